@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+# Resolve the service root (apps/api) that contains src/ and the *_manifest/
+# directories once, instead of every dependencies module walking up from its own
+# location.
+SERVICE_ROOT = Path(__file__).resolve().parents[2]
+
+__all__ = ["SERVICE_ROOT"]
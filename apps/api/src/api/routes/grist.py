@@ -8,9 +8,12 @@ from core.cache.grist_inquiry_idempotency import (
     load_grist_inquiry_idempotency_config,
 )
 from core.grist.exceptions import MedusaOrderFetchError
-from core.grist.inquiry_handler import handle_inquiries
-from fastapi import APIRouter, HTTPException, status
+from core.grist.inquiry_handler import dispatch_inquiries, prepare_inquiries
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from models.customer_inquiry_model import Inquiries
+from pydantic import ValidationError
 
 router = APIRouter(prefix="/grist", tags=["grist"])
 idempotency_store = GristInquiryIdempotencyStore(
@@ -18,21 +21,43 @@ idempotency_store = GristInquiryIdempotencyStore(
 )
 
 
-@router.post("/new_inquiry_webhook")
-async def grist_status(inquiries: Inquiries) -> dict:
-    """Handles new customer inquiries and sends a message to the Telegram group."""
+@router.post(
+    "/new_inquiry_webhook",
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    # The body is read by hand below, so declare it for the OpenAPI schema.
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": Inquiries.model_json_schema()}},
+        }
+    },
+)
+async def grist_status(
+    request: Request, background_tasks: BackgroundTasks
+) -> ORJSONResponse:
+    """Accept new customer inquiries and queue their Telegram/Nextcloud notifications."""
+    # Validate straight from bytes so pydantic-core parses and validates in one
+    # pass instead of FastAPI decoding to Python objects first.
+    body = await request.body()
+    try:
+        inquiries = Inquiries.model_validate_json(body)
+    except ValidationError as exc:
+        # Match FastAPI's own body errors, which are located under "body"; this
+        # also gives invalid JSON (an empty loc from pydantic) a location.
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in exc.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body) from exc
     now = datetime.now(UTC)
-    telegram_sender = telegram_app.bot if telegram_app is not None else None
     try:
-        message_count = await handle_inquiries(
+        dispatch = await prepare_inquiries(
             inquiries=inquiries,
             now=now,
             medusa_governor=medusa_governor,
             nextcloud_governor=nextcloud_governor,
             idempotency_store=idempotency_store,
-            telegram_sender=telegram_sender,
-            telegram_chat_id=TELEGRAM_INQURY_GROUP_CHAT_ID,
-            bot_enabled=BOT_ENABLED,
         )
     except MedusaOrderFetchError as exc:
         raise HTTPException(
@@ -40,4 +65,20 @@ async def grist_status(inquiries: Inquiries) -> dict:
             detail="Failed to fetch Medusa order information",
         ) from exc
 
-    return {"status": "messages sent", "count": message_count}
+    # Idempotency rows exist before acknowledging; delivery runs after the
+    # response so slow Telegram/Nextcloud calls do not hold the webhook open.
+    # Notifications that still fail after dispatch_inquiries' retries, or are
+    # queued when the process restarts, are not redelivered.
+    background_tasks.add_task(
+        dispatch_inquiries,
+        dispatch,
+        idempotency_store,
+        telegram_app.bot if telegram_app is not None else None,
+        TELEGRAM_INQURY_GROUP_CHAT_ID,
+        BOT_ENABLED,
+    )
+    # Returning the response directly skips FastAPI's response-model encoding.
+    return ORJSONResponse(
+        {"status": "messages queued", "count": len(dispatch.messages)},
+        status_code=status.HTTP_202_ACCEPTED,
+    )
@@ -12,13 +12,22 @@ from .dependencies import governor
 T = TypeVar("T")
 
 
-def with_grocy_manager(instance_index: str, op: Callable[[object], T]) -> T:
+async def with_grocy_manager(
+    instance_index: str, op: Callable[..., T], *args: object
+) -> T:
+    """Run ``op(manager, *args)`` in the threadpool, mapping errors to HTTP."""
+    return await run_in_threadpool(_run_with_grocy_manager, instance_index, op, *args)
+
+
+def _run_with_grocy_manager(
+    instance_index: str, op: Callable[..., T], *args: object
+) -> T:
     try:
         manager = governor.manager_for(instance_index)
     except MetadataNotFoundError as error:
         raise HTTPException(status_code=404, detail=str(error)) from error
     try:
-        return op(manager)
+        return op(manager, *args)
     except MetadataNotFoundError as error:
         raise HTTPException(status_code=404, detail=str(error)) from error
     except ValueError as error:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from pathlib import Path
-
+from api.paths import SERVICE_ROOT
 from core.grocy import (
     GrocyGovernor,
     InstanceCredentialsRepository,
@@ -11,8 +10,6 @@ from fastapi import APIRouter
 
 router = APIRouter(prefix="/grocy", tags=["grocy"])
 
-# Resolve the service root (apps/api) that contains src/ and grocy_manifest/.
-SERVICE_ROOT = Path(__file__).resolve().parents[4]
 MANIFEST_ROOT = SERVICE_ROOT / "grocy_manifest"
 
 metadata_repository = InstanceMetadataRepository(MANIFEST_ROOT)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Callable
 
 import requests
@@ -11,43 +10,47 @@ from core.grocy.note_metadata import (
     decode_structured_note,
     normalize_product_description_metadata,
 )
+from core.grocy.responses import GrocyStockEntry
 from fastapi import HTTPException
 from fastapi.concurrency import run_in_threadpool
-from models.grocy import GrocyProductInventoryEntry, GrocyStockEntryPayload
+from models.grocy import (
+    GrocyProductInventoryEntry,
+    GrocyStockEntryPayload,
+    ProductDescriptionMetadataPayload,
+)
 
 from .dependencies import governor
 
 
 def serialize_inventory_view(view: ProductInventoryView) -> GrocyProductInventoryEntry:
     """Convert a ProductInventoryView into the API response model."""
-    decoded_description = decode_structured_note(view.product.description)
-    description_text = decoded_description.note or None
+    description_text = None
     description_metadata = None
-    if decoded_description.metadata is not None:
-        metadata = decoded_description.metadata
-        if isinstance(metadata, ProductDescriptionMetadata):
-            metadata = normalize_product_description_metadata(
-                metadata, view.unit_name_lookup
-            )
-        payload = metadata.to_api_payload()
-        description_metadata = payload or None
-    product_dict = asdict(view.product)
+    # Most products and stock rows carry no note, so skip decoding entirely.
+    if view.product.description:
+        decoded_description = decode_structured_note(view.product.description)
+        description_text = decoded_description.note or None
+        if decoded_description.metadata is not None:
+            metadata = decoded_description.metadata
+            if isinstance(metadata, ProductDescriptionMetadata):
+                metadata = normalize_product_description_metadata(
+                    metadata, view.unit_name_lookup
+                )
+            payload = metadata.to_api_payload()
+            if payload:
+                description_metadata = ProductDescriptionMetadataPayload.model_validate(
+                    payload
+                )
+    # Grocy response dataclasses are flat (scalars/datetimes only) and not
+    # slotted, so a shallow __dict__ copy replaces asdict's recursive deepcopy.
+    product_dict = dict(view.product.__dict__)
     product_dict["description"] = description_text
     product_dict["description_metadata"] = description_metadata
-    stocks: list[GrocyStockEntryPayload] = []
-    for stock in view.stocks:
-        decoded_note = decode_structured_note(stock.note)
-        stock_dict = {
-            key: value
-            for key, value in asdict(stock).items()
-            if key not in {"product_id", "note"}
-        }
-        stock_dict["note"] = decoded_note.note or None
-        if decoded_note.metadata is not None:
-            stock_dict["note_metadata"] = decoded_note.metadata.to_api_payload()
-        stocks.append(GrocyStockEntryPayload(**stock_dict))
+    stocks = [serialize_stock_entry(stock) for stock in view.stocks]
 
-    return GrocyProductInventoryEntry(
+    # Grocy dataclasses are already parsed into the response field types, so
+    # re-validating every row only burns CPU on large product lists.
+    return GrocyProductInventoryEntry.model_construct(
         **product_dict,
         last_stock_updated_at=view.last_updated_at,
         product_group_name=view.product_group_name,
@@ -59,6 +62,20 @@ def serialize_inventory_view(view: ProductInventoryView) -> GrocyProductInventor
     )
 
 
+def serialize_stock_entry(stock: GrocyStockEntry) -> GrocyStockEntryPayload:
+    """Convert a Grocy stock entry into the API payload, decoding its note."""
+    stock_dict = dict(stock.__dict__)
+    del stock_dict["product_id"]
+    if stock.note:
+        decoded_note = decode_structured_note(stock.note)
+        stock_dict["note"] = decoded_note.note or None
+        if decoded_note.metadata is not None:
+            stock_dict["note_metadata"] = decoded_note.metadata.to_api_payload()
+    else:
+        stock_dict["note"] = None
+    return GrocyStockEntryPayload.model_construct(**stock_dict)
+
+
 async def execute_product_mutation(
     instance_index: str,
     product_id: int,
@@ -68,17 +85,13 @@ async def execute_product_mutation(
 ) -> ProductInventoryView:
     """Run a Grocy mutation and return the refreshed product view."""
 
-    def _apply_mutation() -> None:
+    def _apply_and_fetch() -> ProductInventoryView:
         manager = governor.manager_for(instance_index)
         mutate(manager, *args, **kwargs)
+        return manager.get_product_inventory(product_id)
 
     try:
-        await run_in_threadpool(_apply_mutation)
-        return await run_in_threadpool(
-            lambda: governor.manager_for(instance_index).get_product_inventory(
-                product_id
-            )
-        )
+        return await run_in_threadpool(_apply_and_fetch)
     except MetadataNotFoundError as error:
         raise HTTPException(status_code=404, detail=str(error)) from error
     except ValueError as error:
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+
+from core.grocy.models import InstanceMetadata
+from core.grocy.responses import GrocyLocation, GrocyShoppingLocation
 from fastapi.concurrency import run_in_threadpool
 from models.grocy import (
     GrocyLocationPayload,
@@ -12,24 +16,32 @@ from models.grocy import (
 from .dependencies import governor, router
 
 
+async def _load_instance(
+    index: str, metadata: InstanceMetadata
+) -> tuple[str, InstanceMetadata, list[GrocyLocation], list[GrocyShoppingLocation]]:
+    """Fetch an instance's location rosters, issuing both Grocy calls concurrently."""
+    manager = await run_in_threadpool(governor.manager_for, index)
+    locations, shopping_locations = await asyncio.gather(
+        run_in_threadpool(manager.list_locations),
+        run_in_threadpool(manager.list_shopping_locations),
+    )
+    return index, metadata, locations, shopping_locations
+
+
 @router.get("/instances", response_model=ListInstancesResponse)
 async def list_instances() -> ListInstancesResponse:
     """List all Grocy instances known to the governor."""
 
-    def _load_instances():
-        instances = []
-        for index, metadata in governor.list_instances_with_metadata():
-            manager = governor.manager_for(index)
-            locations = manager.list_locations()
-            shopping_locations = manager.list_shopping_locations()
-            instances.append((index, metadata, locations, shopping_locations))
-        return instances
-
-    instance_metadata = await run_in_threadpool(_load_instances)
+    instances = await run_in_threadpool(governor.list_instances_with_metadata)
+    instance_metadata = await asyncio.gather(
+        *(_load_instance(index, metadata) for index, metadata in instances)
+    )
+    # Metadata and location dataclasses are already parsed into the payload
+    # field types, so the payloads skip re-validation.
     summaries = []
     for index, metadata, locations, shopping_locations in instance_metadata:
         address_payload = (
-            InstanceAddressPayload(
+            InstanceAddressPayload.model_construct(
                 line1=metadata.address.line1,
                 line2=metadata.address.line2,
                 city=metadata.address.city,
@@ -41,7 +53,7 @@ async def list_instances() -> ListInstancesResponse:
             else None
         )
         location_payloads = [
-            GrocyLocationPayload(
+            GrocyLocationPayload.model_construct(
                 id=location.id,
                 name=location.name,
                 description=location.description,
@@ -52,7 +64,7 @@ async def list_instances() -> ListInstancesResponse:
             for location in locations
         ]
         shopping_location_payloads = [
-            GrocyShoppingLocationPayload(
+            GrocyShoppingLocationPayload.model_construct(
                 id=location.id,
                 name=location.name,
                 description=location.description,
@@ -62,7 +74,7 @@ async def list_instances() -> ListInstancesResponse:
             for location in shopping_locations
         ]
         summaries.append(
-            InstanceSummary(
+            InstanceSummary.model_construct(
                 instance_index=index,
                 location_name=metadata.location_name,
                 location_types=metadata.location_types,
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from core.grocy.inventory import InventoryAdjustment, InventoryCorrection
+from core.grocy.manager import GrocyManager
 from core.grocy.note_metadata import InventoryCorrectionNoteMetadata, validate_note_text
 from fastapi import HTTPException
 from models.grocy import (
     GrocyProductInventoryEntry,
     InventoryAdjustmentRequest,
+    InventoryCorrectionMetadataPayload,
     InventoryCorrectionRequest,
 )
 
@@ -13,6 +15,24 @@ from .dependencies import router
 from .helpers import execute_product_mutation, serialize_inventory_view
 
 
+def _build_correction_metadata(
+    metadata: InventoryCorrectionMetadataPayload | None, note: str | None
+) -> InventoryCorrectionNoteMetadata | None:
+    """Validate the note and build loss metadata for corrections and adjustments."""
+    try:
+        validate_note_text(note)
+        if metadata is None or not metadata.losses:
+            return None
+        return InventoryCorrectionNoteMetadata(
+            losses=[
+                {"reason": detail.reason, "note": detail.note}
+                for detail in metadata.losses
+            ]
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 @router.post(
     "/{instance_index}/products/{product_id}/inventory",
     response_model=GrocyProductInventoryEntry,
@@ -23,20 +43,7 @@ async def correct_product_inventory(
     correction: InventoryCorrectionRequest,
 ) -> GrocyProductInventoryEntry:
     """Apply an inventory correction for the specified product."""
-
-    metadata: InventoryCorrectionNoteMetadata | None = None
-    try:
-        if correction.metadata is not None:
-            loss_entries = [
-                {"reason": detail.reason, "note": detail.note}
-                for detail in (correction.metadata.losses or [])
-            ]
-            if loss_entries:
-                metadata = InventoryCorrectionNoteMetadata(losses=loss_entries)
-        validate_note_text(correction.note)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-
+    metadata = _build_correction_metadata(correction.metadata, correction.note)
     mutation = InventoryCorrection(
         new_amount=correction.new_amount,
         best_before_date=correction.best_before_date,
@@ -47,7 +54,8 @@ async def correct_product_inventory(
     updated_product = await execute_product_mutation(
         instance_index,
         product_id,
-        lambda manager, payload: manager.correct_product_inventory(product_id, payload),
+        GrocyManager.correct_product_inventory,
+        product_id,
         mutation,
     )
     return serialize_inventory_view(updated_product)
@@ -63,20 +71,7 @@ async def adjust_product_inventory(
     adjustment: InventoryAdjustmentRequest,
 ) -> GrocyProductInventoryEntry:
     """Apply a delta-based inventory adjustment for the specified product."""
-
-    metadata: InventoryCorrectionNoteMetadata | None = None
-    try:
-        if adjustment.metadata is not None:
-            loss_entries = [
-                {"reason": detail.reason, "note": detail.note}
-                for detail in (adjustment.metadata.losses or [])
-            ]
-            if loss_entries:
-                metadata = InventoryCorrectionNoteMetadata(losses=loss_entries)
-        validate_note_text(adjustment.note)
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-
+    metadata = _build_correction_metadata(adjustment.metadata, adjustment.note)
     mutation = InventoryAdjustment(
         delta_amount=adjustment.delta_amount,
         best_before_date=adjustment.best_before_date,
@@ -88,9 +83,8 @@ async def adjust_product_inventory(
         updated_product = await execute_product_mutation(
             instance_index,
             product_id,
-            lambda manager, payload: manager.adjust_product_inventory(
-                product_id, payload
-            ),
+            GrocyManager.adjust_product_inventory,
+            product_id,
             mutation,
         )
     except ValueError as exc:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from core.grocy.exceptions import ManifestNotFoundError, MetadataNotFoundError
 from fastapi import HTTPException
 from fastapi.concurrency import run_in_threadpool
@@ -8,6 +10,7 @@ from models.grocy import (
     CreatedQuantityUnit,
     CreatedShoppingLocation,
     InitializeInstanceResponse,
+    ReloadInstanceResponse,
 )
 
 from .dependencies import governor, router
@@ -16,16 +19,13 @@ from .dependencies import governor, router
 @router.post("/{instance_index}/initialize", response_model=InitializeInstanceResponse)
 async def initialize_instance(instance_index: str) -> InitializeInstanceResponse:
     """Ensure the requested Grocy instance is seeded with universal manifests."""
-
-    def _sync_manifest():
-        groups = governor.ensure_product_groups(instance_index)
-        units = governor.ensure_quantity_units(instance_index)
-        shopping_locations = governor.ensure_shopping_locations(instance_index)
-        return groups, units, shopping_locations
-
+    # Product groups, quantity units, and shopping locations are independent
+    # Grocy objects, so their syncs overlap instead of stacking round-trips.
     try:
-        groups_result, units_result, shopping_location_result = await run_in_threadpool(
-            _sync_manifest
+        groups_result, units_result, shopping_location_result = await asyncio.gather(
+            run_in_threadpool(governor.ensure_product_groups, instance_index),
+            run_in_threadpool(governor.ensure_quantity_units, instance_index),
+            run_in_threadpool(governor.ensure_shopping_locations, instance_index),
         )
     except MetadataNotFoundError as error:
         raise HTTPException(status_code=404, detail=str(error)) from error
@@ -54,3 +54,10 @@ async def initialize_instance(instance_index: str) -> InitializeInstanceResponse
         shopping_location_identifiers=shopping_location_result.identifier_by_normalized_name,
         created_shopping_locations=created_shopping_locations,
     )
+
+
+@router.post("/{instance_index}/reload", response_model=ReloadInstanceResponse)
+async def reload_instance(instance_index: str) -> ReloadInstanceResponse:
+    """Drop the cached manager so the next request re-reads metadata and credentials."""
+    cleared = governor.clear_manager(instance_index)
+    return ReloadInstanceResponse(instance_index=instance_index, cleared=cleared)
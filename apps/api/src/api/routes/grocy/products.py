@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import batched
+from typing import Iterator, Sequence
 
-from core.grocy.exceptions import MetadataNotFoundError
+import orjson
+from core.grocy.inventory import ProductInventoryView
+from core.grocy.manager import GrocyManager
 from core.grocy.updates import build_product_metadata_updates
-from fastapi import HTTPException, Request
+from fastapi import Request
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response
 from models.grocy import (
     GrocyProductInventoryEntry,
     GrocyProductsResponse,
@@ -24,59 +29,73 @@ class GrocyProductsQuery:
     force_refresh: bool
 
 
+# Rows are dumped in batches so only one batch of row dicts is alive at a time
+# while the body is assembled.
+_PRODUCT_SERIALIZE_BATCH_SIZE = 100
+
+
 def _parse_products_query(request: Request) -> GrocyProductsQuery:
     return GrocyProductsQuery(force_refresh=parse_force_refresh(request))
 
 
-@router.get("/{instance_index}/products", response_model=GrocyProductsResponse)
-async def list_products(instance_index: str, request: Request) -> GrocyProductsResponse:
-    """Return Grocy products enriched with stock quantities and recency info."""
-    query = _parse_products_query(request)
-
-    def _load_products():
-        return with_grocy_manager(
-            instance_index,
-            lambda manager: (
-                manager.force_refresh_product_inventory()
-                or manager.list_product_inventory()
-                if query.force_refresh
-                else manager.list_product_inventory()
-            ),
+def _iter_products_body(
+    instance_index: str, inventory_views: Sequence[ProductInventoryView]
+) -> Iterator[bytes]:
+    """Yield a GrocyProductsResponse body without materializing every row at once."""
+    yield b'{"instance_index":' + orjson.dumps(instance_index) + b',"products":['
+    for position, views in enumerate(
+        batched(inventory_views, _PRODUCT_SERIALIZE_BATCH_SIZE)
+    ):
+        rows = b",".join(
+            orjson.dumps(serialize_inventory_view(view).model_dump(mode="json"))
+            for view in views
         )
+        yield b"," + rows if position else rows
+    yield b"]}"
 
-    try:
-        inventory_views = await run_in_threadpool(_load_products)
-    except MetadataNotFoundError as error:
-        raise HTTPException(status_code=404, detail=str(error)) from error
 
-    shaped_products = [serialize_inventory_view(view) for view in inventory_views]
+def _build_products_body(
+    instance_index: str, inventory_views: Sequence[ProductInventoryView]
+) -> bytes:
+    return b"".join(_iter_products_body(instance_index, inventory_views))
 
-    return GrocyProductsResponse(
-        instance_index=instance_index, products=shaped_products
+
+@router.get("/{instance_index}/products", response_model=GrocyProductsResponse)
+async def list_products(instance_index: str, request: Request) -> Response:
+    """Return Grocy products enriched with stock quantities and recency info."""
+    query = _parse_products_query(request)
+
+    inventory_views = await with_grocy_manager(
+        instance_index,
+        lambda manager: (
+            manager.force_refresh_product_inventory()
+            or manager.list_product_inventory()
+            if query.force_refresh
+            else manager.list_product_inventory()
+        ),
     )
+    # The body is fully serialized off the event loop before anything is sent, so
+    # a failing row surfaces as a 500 instead of a truncated 200.
+    # response_model stays on the route for the OpenAPI schema only.
+    body = await run_in_threadpool(
+        _build_products_body, instance_index, inventory_views
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
-    "/{instance_index}/products/{product_id}", response_model=GrocyProductInventoryEntry
+    "/{instance_index}/products/{product_id}",
+    response_model=GrocyProductInventoryEntry,
+    response_class=ORJSONResponse,
 )
-async def get_product(
-    instance_index: str, product_id: int
-) -> GrocyProductInventoryEntry:
+async def get_product(instance_index: str, product_id: int) -> ORJSONResponse:
     """Return a single Grocy product with fresh stock entries."""
-
-    def _load_product():
-        return with_grocy_manager(
-            instance_index, lambda manager: manager.get_product_inventory(product_id)
-        )
-
-    try:
-        inventory_view = await run_in_threadpool(_load_product)
-    except MetadataNotFoundError as error:
-        raise HTTPException(status_code=404, detail=str(error)) from error
-    except ValueError as error:
-        raise HTTPException(status_code=404, detail=str(error)) from error
-
-    return serialize_inventory_view(inventory_view)
+    inventory_view = await with_grocy_manager(
+        instance_index, GrocyManager.get_product_inventory, product_id
+    )
+    return ORJSONResponse(
+        serialize_inventory_view(inventory_view).model_dump(mode="json")
+    )
 
 
 @router.post(
@@ -88,23 +107,17 @@ async def update_product_description_metadata(
     payload: ProductDescriptionMetadataBatchRequest,
 ) -> GrocyProductsResponse:
     """Apply structured description metadata updates to the specified products."""
-
-    def _apply_updates():
-        return with_grocy_manager(
-            instance_index,
-            lambda manager: manager.update_product_description_metadata(
+    # Shape rows inside the worker hop so a large batch does not serialize on
+    # the event loop; conversion errors still surface as 400s.
+    shaped_products = await with_grocy_manager(
+        instance_index,
+        lambda manager: [
+            serialize_inventory_view(view)
+            for view in manager.update_product_description_metadata(
                 build_product_metadata_updates(payload)
-            ),
-        )
-
-    try:
-        updated_views = await run_in_threadpool(_apply_updates)
-    except MetadataNotFoundError as error:
-        raise HTTPException(status_code=404, detail=str(error)) from error
-    except ValueError as error:
-        raise HTTPException(status_code=400, detail=str(error)) from error
-
-    shaped_products = [serialize_inventory_view(view) for view in updated_views]
+            )
+        ],
+    )
     return GrocyProductsResponse(
         instance_index=instance_index, products=shaped_products
     )
@@ -1,26 +1,34 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import calendar
 import logging
 from dataclasses import dataclass
-from datetime import date, datetime, time
+from datetime import date, datetime, tzinfo
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from zoneinfo import ZoneInfo
 
-from core.grocy.exceptions import ManifestNotFoundError, MetadataNotFoundError
+import orjson
+from cachetools import TTLCache
+from core.grocy.exceptions import MetadataNotFoundError
+from core.grocy.inventory import ProductInventoryView
 from core.grocy.note_metadata import (
     PurchaseEntryNoteMetadata,
-    decode_structured_note,
     validate_note_text,
 )
-from core.grocy.purchases import PurchaseEntry, PurchaseEntryDraft
-from core.grocy.responses import GrocyStockEntry
-from fastapi import HTTPException, Request
+from core.grocy.purchases import (
+    PurchaseEntry,
+    PurchaseEntryDefaults,
+    PurchaseEntryDraft,
+)
+from core.grocy.responses import GrocyShoppingLocation, GrocyStockEntry
+from core.grocy.updates import build_purchase_note_metadata
+from fastapi import BackgroundTasks, HTTPException, Request, Response
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from models.grocy import (
-    GrocyProductInventoryEntry,
     GrocyStockEntryPayload,
     PurchaseEntryCalculationRequest,
     PurchaseEntryCalculationResponse,
@@ -33,10 +41,32 @@ from models.grocy import (
 from shared.grist_service import create_grist_purchase_record
 
 from .dependencies import governor, router
-from .helpers import execute_product_mutation, serialize_inventory_view
+from .helpers import execute_product_mutation, serialize_stock_entry
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA_ROOT = Path(__file__).resolve().parents[6] / "schemas"
+_SHOPPING_LOCATION_NAMES_TTL_SECONDS = 60
+
+# Per-instance id -> name lookups used to label Grist purchase records. Only
+# touched from the event loop, so the TTLCache needs no thread lock; the
+# asyncio locks coalesce concurrent misses into one manager fetch.
+_shopping_location_names: TTLCache[str, dict[int, str]] = TTLCache(
+    maxsize=64, ttl=_SHOPPING_LOCATION_NAMES_TTL_SECONDS
+)
+_shopping_location_name_locks: dict[str, asyncio.Lock] = {}
+
+# Single-product defaults lookups arriving within the window for the same
+# (instance, shopping location) share one threadpool hop; a full batch flushes
+# early so a burst never waits longer than the window.
+_PURCHASE_DEFAULTS_BATCH_WINDOW_SECONDS = 0.005
+_PURCHASE_DEFAULTS_BATCH_MAX_SIZE = 64
+_pending_purchase_defaults: dict[
+    tuple[str, int | None],
+    dict[int, list[asyncio.Future[PurchaseEntryDefaults]]],
+] = {}
+_purchase_defaults_flushes: set[asyncio.Task[None]] = set()
+
 
 @dataclass(frozen=True)
 class PurchaseDefaultsQuery:
@@ -45,34 +75,57 @@ class PurchaseDefaultsQuery:
 
 def _parse_purchase_defaults_query(request: Request) -> PurchaseDefaultsQuery:
     raw_value = request.query_params.get("shopping_location_id")
-    if raw_value is None:
-        return PurchaseDefaultsQuery(shopping_location_id=None)
-    trimmed = raw_value.strip()
-    if not trimmed:
-        return PurchaseDefaultsQuery(shopping_location_id=None)
     try:
-        return PurchaseDefaultsQuery(shopping_location_id=int(trimmed))
+        shopping_location_id = _parse_shopping_location_id(raw_value)
     except ValueError as exc:
         raise HTTPException(
             status_code=400, detail="shopping_location_id must be an integer."
         ) from exc
+    return PurchaseDefaultsQuery(shopping_location_id=shopping_location_id)
+
+
+# The UI polls defaults with a handful of distinct location ids; invalid values
+# raise and are therefore never cached.
+@lru_cache(maxsize=512)
+def _parse_shopping_location_id(raw_value: str | None) -> int | None:
+    if raw_value is None:
+        return None
+    trimmed = raw_value.strip()
+    if not trimmed:
+        return None
+    return int(trimmed)
 
 
-def _schema_root() -> Path:
-    return Path(__file__).resolve().parents[6] / "schemas"
+def _build_defaults_metadata_payload(
+    defaults: PurchaseEntryDefaults,
+) -> PurchaseEntryMetadataPayload:
+    # Defaults come from typed core dataclasses, so skip re-validation.
+    return PurchaseEntryMetadataPayload.model_construct(
+        shipping_cost=defaults.shipping_cost,
+        tax_rate=defaults.tax_rate,
+        brand=defaults.brand,
+        package_size=defaults.package_size,
+        package_price=defaults.package_price,
+        package_quantity=defaults.package_quantity,
+        currency=defaults.currency,
+        conversion_rate=defaults.conversion_rate,
+        on_sale=defaults.on_sale,
+    )
 
 
 def _load_shared_purchase_schema() -> dict[str, Any]:
-    schema_path = _schema_root() / "purchase-entry-request.schema.json"
+    schema_path = _SCHEMA_ROOT / "purchase-entry-request.schema.json"
     if not schema_path.exists():
         raise FileNotFoundError(f"Missing shared purchase entry schema: {schema_path}")
-    with schema_path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return orjson.loads(schema_path.read_bytes())
 
 
 def _ensure_schema_alignment(schema: dict[str, Any]) -> None:
-    model_schema = PurchaseEntryRequest.model_json_schema()
-    model_properties = set(model_schema.get("properties", {}).keys())
+    # model_fields carries the same top-level property names the JSON schema
+    # would emit, without running the full schema generator at import.
+    model_properties = {
+        field.alias or name for name, field in PurchaseEntryRequest.model_fields.items()
+    }
     shared_properties = set(schema.get("properties", {}).keys())
     if model_properties != shared_properties:
         raise RuntimeError(
@@ -97,30 +150,37 @@ def _resolve_package_batch(
     return None
 
 
-def _serialize_stock_entries(
-    entries: list[GrocyStockEntry],
-) -> list[GrocyStockEntryPayload]:
-    serialized: list[GrocyStockEntryPayload] = []
-    for entry in entries:
-        decoded_note = decode_structured_note(entry.note)
-        payload: dict[str, Any] = {
-            "id": entry.id,
-            "amount": entry.amount,
-            "best_before_date": entry.best_before_date,
-            "purchased_date": entry.purchased_date,
-            "stock_id": entry.stock_id,
-            "price": entry.price,
-            "open": entry.open,
-            "opened_date": entry.opened_date,
-            "row_created_timestamp": entry.row_created_timestamp,
-            "location_id": entry.location_id,
-            "shopping_location_id": entry.shopping_location_id,
-            "note": decoded_note.note or None,
-        }
-        if decoded_note.metadata is not None:
-            payload["note_metadata"] = decoded_note.metadata.to_api_payload()
-        serialized.append(GrocyStockEntryPayload(**payload))
-    return serialized
+def _booking_stock_ids(
+    response: dict[str, Any] | list[dict[str, Any]] | None,
+) -> list[str]:
+    if not response:
+        return []
+    bookings = response if isinstance(response, list) else [response]
+    return [str(booking["stock_id"]) for booking in bookings if booking.get("stock_id")]
+
+
+def _select_new_stock_entries(
+    stocks: list[GrocyStockEntry],
+    recorded_stock_ids: set[str],
+    expected_entries: int,
+) -> list[GrocyStockEntry]:
+    """Return the stock rows created by a purchase, oldest first.
+
+    Falls back to the newest rows when Grocy's bookings did not identify enough of
+    them (e.g. a response without stock_id).
+    """
+    new_entries = sorted(
+        (entry for entry in stocks if entry.stock_id in recorded_stock_ids),
+        key=lambda entry: entry.row_created_timestamp,
+    )
+    if len(new_entries) < expected_entries:
+        logger.warning(
+            "Purchase entry count mismatch; expected %s new entries but found %s. Falling back to latest entries.",
+            expected_entries,
+            len(new_entries),
+        )
+        new_entries = sorted(stocks, key=lambda entry: entry.row_created_timestamp)
+    return new_entries[-expected_entries:]
 
 
 def _build_purchase_drafts(
@@ -130,90 +190,84 @@ def _build_purchase_drafts(
     resolved_price: float,
     shopping_location_id: int | None,
 ) -> list[PurchaseEntryDraft]:
+    def _draft(amount: float, note: str) -> PurchaseEntryDraft:
+        return PurchaseEntryDraft(
+            amount=amount,
+            price_per_unit=resolved_price,
+            best_before_date=purchase.best_before_date,
+            purchased_date=purchase.purchased_date,
+            location_id=purchase.location_id,
+            shopping_location_id=shopping_location_id,
+            note=note,
+            metadata=metadata,
+        )
+
+    base_note = (purchase.note or "").strip()
     package_batch = _resolve_package_batch(metadata)
+    # Most purchases are a single entry, so skip the per-package tagging loop.
     if package_batch is None:
-        entry_amount = resolved_amount
-        entry_count = 1
-    else:
-        entry_count, package_size = package_batch
-        entry_amount = package_size
+        return [_draft(resolved_amount, base_note)]
+    entry_count, package_size = package_batch
+    if entry_count == 1:
+        return [_draft(package_size, base_note)]
     drafts: list[PurchaseEntryDraft] = []
-    base_note = (purchase.note or "").strip()
     for index in range(entry_count):
-        tag = f"(package {index + 1}/{entry_count})" if entry_count > 1 else ""
-        resolved_note = base_note
-        if tag:
-            resolved_note = f"{base_note} {tag}".strip() if base_note else tag
-        drafts.append(
-            PurchaseEntryDraft(
-                amount=entry_amount,
-                price_per_unit=resolved_price,
-                best_before_date=purchase.best_before_date,
-                purchased_date=purchase.purchased_date,
-                location_id=purchase.location_id,
-                shopping_location_id=shopping_location_id,
-                note=resolved_note,
-                metadata=metadata,
-            )
-        )
+        tag = f"(package {index + 1}/{entry_count})"
+        drafts.append(_draft(package_size, f"{base_note} {tag}" if base_note else tag))
     return drafts
 
 
-_PURCHASE_ENTRY_SCHEMA = _load_shared_purchase_schema()
-_ensure_schema_alignment(_PURCHASE_ENTRY_SCHEMA)
+def _load_purchase_entry_schema_bytes() -> bytes:
+    schema = _load_shared_purchase_schema()
+    _ensure_schema_alignment(schema)
+    return orjson.dumps(schema)
+
+
+# The schema is static for the process lifetime; only its encoded bytes are
+# kept, so requests never re-encode it and no mutable dict is left to alter.
+_PURCHASE_ENTRY_SCHEMA_BYTES = _load_purchase_entry_schema_bytes()
 
 
 @router.get(
     "/{instance_index}/products/{product_id}/purchase/defaults",
     response_model=PurchaseEntryDefaultsResponse,
+    response_class=ORJSONResponse,
 )
 async def get_purchase_entry_defaults(
     instance_index: str,
     product_id: int,
     request: Request,
-) -> PurchaseEntryDefaultsResponse:
+) -> ORJSONResponse:
     """Return default metadata suggestions for purchase entries."""
     query = _parse_purchase_defaults_query(request)
 
-    def _load_defaults():
-        manager = governor.manager_for(instance_index)
-        return manager.get_purchase_entry_defaults(
-            product_id, query.shopping_location_id
-        )
-
     try:
-        defaults = await run_in_threadpool(_load_defaults)
+        defaults = await _load_purchase_defaults(
+            instance_index, product_id, query.shopping_location_id
+        )
     except MetadataNotFoundError as error:
         raise HTTPException(status_code=404, detail=str(error)) from error
     except ValueError as error:
         raise HTTPException(status_code=404, detail=str(error)) from error
 
-    metadata_payload = PurchaseEntryMetadataPayload(
-        shipping_cost=defaults.shipping_cost,
-        tax_rate=defaults.tax_rate,
-        brand=defaults.brand,
-        package_size=defaults.package_size,
-        package_price=defaults.package_price,
-        package_quantity=defaults.package_quantity,
-        currency=defaults.currency,
-        conversion_rate=defaults.conversion_rate,
-        on_sale=defaults.on_sale,
-    )
-    return PurchaseEntryDefaultsResponse(
-        product_id=product_id,
-        shopping_location_id=query.shopping_location_id,
-        metadata=metadata_payload,
+    return ORJSONResponse(
+        PurchaseEntryDefaultsResponse.model_construct(
+            product_id=product_id,
+            shopping_location_id=query.shopping_location_id,
+            metadata=_build_defaults_metadata_payload(defaults),
+        ).model_dump(mode="json")
     )
 
 
 @router.post(
     "/{instance_index}/purchases/defaults",
     response_model=PurchaseEntryDefaultsBatchResponse,
+    response_class=ORJSONResponse,
 )
 async def get_purchase_entry_defaults_batch(
     instance_index: str,
     payload: PurchaseEntryDefaultsBatchRequest,
-) -> PurchaseEntryDefaultsBatchResponse:
+) -> ORJSONResponse:
     """Return default metadata suggestions for multiple products."""
     if not payload.product_ids:
         raise HTTPException(
@@ -244,35 +298,28 @@ async def get_purchase_entry_defaults_batch(
             ),
         )
 
-    shaped: list[PurchaseEntryDefaultsResponse] = []
-    for index, product_id in enumerate(payload.product_ids):
-        item = defaults[index]
-        metadata_payload = PurchaseEntryMetadataPayload(
-            shipping_cost=item.shipping_cost,
-            tax_rate=item.tax_rate,
-            brand=item.brand,
-            package_size=item.package_size,
-            package_price=item.package_price,
-            package_quantity=item.package_quantity,
-            currency=item.currency,
-            conversion_rate=item.conversion_rate,
-            on_sale=item.on_sale,
-        )
-        shaped.append(
-            PurchaseEntryDefaultsResponse(
-                product_id=product_id,
-                shopping_location_id=payload.shopping_location_id,
-                metadata=metadata_payload,
-            )
+    shaped = [
+        PurchaseEntryDefaultsResponse.model_construct(
+            product_id=product_id,
+            shopping_location_id=payload.shopping_location_id,
+            metadata=_build_defaults_metadata_payload(item),
         )
+        for product_id, item in zip(payload.product_ids, defaults, strict=True)
+    ]
 
-    return PurchaseEntryDefaultsBatchResponse(defaults=shaped)
+    # Returning the response directly skips FastAPI's response_model
+    # re-validation and jsonable_encoder pass; orjson encodes the dumped dict.
+    return ORJSONResponse(
+        PurchaseEntryDefaultsBatchResponse.model_construct(defaults=shaped).model_dump(
+            mode="json"
+        )
+    )
 
 
-@router.get("/purchases/schema")
-async def get_purchase_entry_schema() -> dict[str, Any]:
+@router.get("/purchases/schema", response_class=Response)
+async def get_purchase_entry_schema() -> Response:
     """Expose the shared JSON schema for purchase entry payloads."""
-    return _PURCHASE_ENTRY_SCHEMA
+    return Response(content=_PURCHASE_ENTRY_SCHEMA_BYTES, media_type="application/json")
 
 
 @router.post(
@@ -283,6 +330,7 @@ async def record_purchase_entry(
     instance_index: str,
     product_id: int,
     purchase: PurchaseEntryRequest,
+    background_tasks: BackgroundTasks,
 ) -> list[GrocyStockEntryPayload]:
     """Record purchase entries for the specified product and return the new stock rows."""
 
@@ -291,17 +339,7 @@ async def record_purchase_entry(
     derived_unit_price: float | None = None
     try:
         if purchase.metadata is not None:
-            candidate = PurchaseEntryNoteMetadata(
-                shipping_cost=purchase.metadata.shipping_cost,
-                tax_rate=purchase.metadata.tax_rate,
-                brand=purchase.metadata.brand,
-                package_size=purchase.metadata.package_size,
-                package_price=purchase.metadata.package_price,
-                package_quantity=purchase.metadata.package_quantity,
-                currency=purchase.metadata.currency,
-                conversion_rate=purchase.metadata.conversion_rate,
-                on_sale=purchase.metadata.on_sale,
-            )
+            candidate = build_purchase_note_metadata(purchase.metadata)
             derived_amount, derived_unit_price, _ = _derive_purchase_amount_and_price(
                 candidate
             )
@@ -337,15 +375,17 @@ async def record_purchase_entry(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     recorded_entries: list[PurchaseEntry] = []
-    baseline_entry_ids: set[int] = set()
+    # Grocy answers each add with the stock bookings it created, so new stock
+    # rows are matched by stock_id instead of diffing a baseline inventory fetch.
+    recorded_stock_ids: set[str] = set()
 
     def _record_purchase(manager, payloads: list[PurchaseEntryDraft]) -> None:
-        nonlocal baseline_entry_ids
-        baseline_view = manager.get_product_inventory(product_id)
-        baseline_entry_ids = {entry.id for entry in baseline_view.stocks}
         for payload in payloads:
-            resolved_entry, _ = manager.record_purchase_entry(product_id, payload)
+            resolved_entry, response = manager.record_purchase_entry(
+                product_id, payload
+            )
             recorded_entries.append(resolved_entry)
+            recorded_stock_ids.update(_booking_stock_ids(response))
 
     updated_product = await execute_product_mutation(
         instance_index, product_id, _record_purchase, drafts
@@ -356,23 +396,9 @@ async def record_purchase_entry(
             status_code=500, detail="Failed to persist purchase entries."
         )
 
-    expected_entries = len(drafts)
-    new_entries = [
-        entry for entry in updated_product.stocks if entry.id not in baseline_entry_ids
-    ]
-    new_entries.sort(key=lambda entry: entry.row_created_timestamp)
-    if len(new_entries) < expected_entries:
-        logger.warning(
-            "Purchase entry count mismatch; expected %s new entries but found %s. Falling back to latest entries.",
-            expected_entries,
-            len(new_entries),
-        )
-        newest = sorted(
-            updated_product.stocks, key=lambda entry: entry.row_created_timestamp
-        )
-        new_entries = newest[-expected_entries:]
-    if len(new_entries) > expected_entries:
-        new_entries = new_entries[-expected_entries:]
+    new_entries = _select_new_stock_entries(
+        updated_product.stocks, recorded_stock_ids, len(drafts)
+    )
 
     purchase_epoch = _compose_purchase_timestamp(
         recorded_entries[0].purchased_date, instance_index
@@ -380,9 +406,8 @@ async def record_purchase_entry(
     shopping_location_name = await _resolve_shopping_location_name(
         instance_index, recorded_entries[0].shopping_location_id
     )
-    serialized_product = serialize_inventory_view(updated_product)
     grist_fields = _build_grist_record_fields(
-        product=serialized_product,
+        inventory_view=updated_product,
         purchase=purchase,
         metadata=metadata,
         recorded_entry=recorded_entries[0],
@@ -391,17 +416,25 @@ async def record_purchase_entry(
     )
     logger.info(
         "Posting purchase to Grist: product=%s on_sale=%s",
-        serialized_product.name,
+        updated_product.product.name,
         grist_fields.get("on_sale"),
     )
+    # Grist is a best-effort ledger; post after the response so its round-trip
+    # stays off the purchase latency.
+    background_tasks.add_task(
+        _post_purchase_to_grist, grist_fields, updated_product.product.name
+    )
+
+    return [serialize_stock_entry(entry) for entry in new_entries]
+
+
+async def _post_purchase_to_grist(
+    grist_fields: dict[str, Any], product_name: str
+) -> None:
     try:
         await create_grist_purchase_record(grist_fields)
     except Exception:  # noqa: BLE001
-        logger.exception(
-            "Failed to post purchase '%s' to Grist", updated_product.product.name
-        )
-
-    return _serialize_stock_entries(new_entries)
+        logger.exception("Failed to post purchase '%s' to Grist", product_name)
 
 
 @router.post(
@@ -416,17 +449,7 @@ async def derive_purchase_entry(
     """Return canonical derived amount and unit price for purchase metadata."""
 
     try:
-        candidate = PurchaseEntryNoteMetadata(
-            shipping_cost=payload.metadata.shipping_cost,
-            tax_rate=payload.metadata.tax_rate,
-            brand=payload.metadata.brand,
-            package_size=payload.metadata.package_size,
-            package_price=payload.metadata.package_price,
-            package_quantity=payload.metadata.package_quantity,
-            currency=payload.metadata.currency,
-            conversion_rate=payload.metadata.conversion_rate,
-            on_sale=payload.metadata.on_sale,
-        )
+        candidate = build_purchase_note_metadata(payload.metadata)
         derived_amount, derived_unit_price, total_usd = (
             _derive_purchase_amount_and_price(candidate)
         )
@@ -447,22 +470,21 @@ def _derive_purchase_amount_and_price(
 ) -> tuple[float | None, float | None, float | None]:
     if metadata is None:
         return None, None, None
-    if (
-        metadata.package_size is None
-        or metadata.package_quantity is None
-        or metadata.package_price is None
-        or metadata.conversion_rate is None
-    ):
+    package_size = metadata.package_size
+    package_quantity = metadata.package_quantity
+    package_price = metadata.package_price
+    conversion_rate = metadata.conversion_rate
+    if None in (package_size, package_quantity, package_price, conversion_rate):
         return None, None, None
-    amount = metadata.package_size * metadata.package_quantity
+    amount = package_size * package_quantity
     if amount <= 0:
         raise ValueError(
             "package_size and quantity must produce a positive purchase amount."
         )
     shipping_cost = metadata.shipping_cost or 0.0
     tax_rate = metadata.tax_rate or 0.0
-    subtotal = metadata.package_price * metadata.package_quantity + shipping_cost
-    total_usd = subtotal * (1 + tax_rate) * metadata.conversion_rate
+    subtotal = package_price * package_quantity + shipping_cost
+    total_usd = subtotal * (1 + tax_rate) * conversion_rate
     if total_usd <= 0:
         raise ValueError(
             "Conversion rate and pricing must produce a positive USD total."
@@ -471,20 +493,19 @@ def _derive_purchase_amount_and_price(
     return amount, unit_price, total_usd
 
 
-def _resolve_product_unit_name(product: GrocyProductInventoryEntry) -> str | None:
-    for candidate in (
-        product.stock_quantity_unit_name,
-        product.purchase_quantity_unit_name,
-        product.consume_quantity_unit_name,
-        product.price_quantity_unit_name,
-    ):
-        if candidate:
-            return candidate
-    return None
+def _resolve_product_unit_name(inventory_view: ProductInventoryView) -> str | None:
+    # First non-empty unit name in stock, purchase, consume, price priority.
+    return (
+        inventory_view.stock_unit_name
+        or inventory_view.purchase_unit_name
+        or inventory_view.consume_unit_name
+        or inventory_view.price_unit_name
+        or None
+    )
 
 
 def _build_grist_record_fields(
-    product: GrocyProductInventoryEntry,
+    inventory_view: ProductInventoryView,
     purchase: PurchaseEntryRequest,
     metadata: PurchaseEntryNoteMetadata | None,
     recorded_entry: PurchaseEntry,
@@ -492,75 +513,139 @@ def _build_grist_record_fields(
     shopping_location_name: str | None,
 ) -> dict[str, Any]:
     fields: dict[str, Any] = {
-        "product": product.name,
+        "product": inventory_view.product.name,
         "purchase_date": purchase_epoch,
         "notes": (purchase.note or "").strip(),
+        "on_sale": False,
+        "local_currency": "USD",
     }
-    fields["on_sale"] = False
-    unit_name = _resolve_product_unit_name(product)
-    if unit_name:
-        fields["unit"] = unit_name
-    if shopping_location_name:
-        fields["vendor"] = shopping_location_name
-    if product.product_group_name:
-        fields["category"] = product.product_group_name
+    labels = (
+        ("unit", _resolve_product_unit_name(inventory_view)),
+        ("vendor", shopping_location_name),
+        ("category", inventory_view.product_group_name),
+    )
+    fields.update((key, value) for key, value in labels if value)
 
     # Grist computes totals via formula columns; avoid posting those fields to prevent write errors.
     if metadata is None:
-        fields.setdefault("local_currency", "USD")
         return fields
 
-    if metadata.package_size is not None:
-        fields["package_size"] = metadata.package_size
-    if metadata.package_quantity is not None:
-        fields["quantity_purchased"] = metadata.package_quantity
-    if metadata.package_price is not None:
-        fields["purchase_price_per_package_local_currency"] = metadata.package_price
-    if metadata.shipping_cost is not None:
-        fields["shipping_fee_local_currency"] = metadata.shipping_cost
-    if metadata.tax_rate is not None:
-        fields["tax_rate"] = metadata.tax_rate
-    if metadata.brand is not None:
-        fields["brand"] = metadata.brand
-    local_currency = (metadata.currency or "").strip().upper()
-    if local_currency:
-        fields["local_currency"] = local_currency
-    else:
-        fields.setdefault("local_currency", "USD")
-    if metadata.conversion_rate is not None:
-        fields["conversion_rate_to_USD_at_purchase_date"] = metadata.conversion_rate
+    metadata_values = (
+        ("package_size", metadata.package_size),
+        ("quantity_purchased", metadata.package_quantity),
+        ("purchase_price_per_package_local_currency", metadata.package_price),
+        ("shipping_fee_local_currency", metadata.shipping_cost),
+        ("tax_rate", metadata.tax_rate),
+        ("brand", metadata.brand),
+        ("conversion_rate_to_USD_at_purchase_date", metadata.conversion_rate),
+    )
+    fields.update((key, value) for key, value in metadata_values if value is not None)
+    fields["local_currency"] = (metadata.currency or "").strip().upper() or "USD"
     # Explicitly coerce to bool so we never leak None or non-boolean types into Grist.
     fields["on_sale"] = bool(metadata.on_sale)
 
     return fields
 
 
-def _compose_purchase_timestamp(purchase_date: date, instance_index: str) -> int:
-    timezone = _instance_timezone(instance_index)
-    now = datetime.now(timezone)
-    target_date = purchase_date or now.date()
-    midnight = datetime.combine(target_date, time(0, tzinfo=timezone))
-    return int(midnight.timestamp())
-
-
-@lru_cache(maxsize=16)
-def _instance_timezone(instance_index: str) -> ZoneInfo:
-    metadata = None
+async def _load_purchase_defaults(
+    instance_index: str, product_id: int, shopping_location_id: int | None
+) -> PurchaseEntryDefaults:
+    key = (instance_index, shopping_location_id)
+    loop = asyncio.get_running_loop()
+    waiters = _pending_purchase_defaults.get(key)
+    if waiters is None:
+        waiters = {}
+        _pending_purchase_defaults[key] = waiters
+        loop.call_later(
+            _PURCHASE_DEFAULTS_BATCH_WINDOW_SECONDS,
+            _flush_purchase_defaults,
+            key,
+            waiters,
+        )
+    future: asyncio.Future[PurchaseEntryDefaults] = loop.create_future()
+    waiters.setdefault(product_id, []).append(future)
+    if len(waiters) >= _PURCHASE_DEFAULTS_BATCH_MAX_SIZE:
+        _flush_purchase_defaults(key, waiters)
+    return await future
+
+
+def _flush_purchase_defaults(
+    key: tuple[str, int | None],
+    waiters: dict[int, list[asyncio.Future[PurchaseEntryDefaults]]],
+) -> None:
+    # The window timer still fires after a size-capped flush took the batch.
+    if _pending_purchase_defaults.get(key) is not waiters:
+        return
+    del _pending_purchase_defaults[key]
+    task = asyncio.create_task(_resolve_purchase_defaults(key, waiters))
+    _purchase_defaults_flushes.add(task)
+    task.add_done_callback(_purchase_defaults_flushes.discard)
+
+
+async def _resolve_purchase_defaults(
+    key: tuple[str, int | None],
+    waiters: dict[int, list[asyncio.Future[PurchaseEntryDefaults]]],
+) -> None:
+    instance_index, shopping_location_id = key
     try:
-        metadata = governor.metadata_repository.load(instance_index)
-    except ManifestNotFoundError:
-        logger.warning(
-            "No metadata found for Grocy instance %s when resolving timezone.",
+        results = await run_in_threadpool(
+            _load_purchase_defaults_batch,
             instance_index,
+            list(waiters),
+            shopping_location_id,
         )
-    tz_name = metadata.instance_timezone if metadata else None
-    if tz_name:
+    except Exception as error:  # noqa: BLE001 - every awaiter must be released
+        results = {product_id: error for product_id in waiters}
+    for product_id, futures in waiters.items():
+        result = results[product_id]
+        for future in futures:
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _load_purchase_defaults_batch(
+    instance_index: str, product_ids: list[int], shopping_location_id: int | None
+) -> dict[int, PurchaseEntryDefaults | Exception]:
+    """Resolve each product separately so one missing product fails only its caller."""
+    manager = governor.manager_for(instance_index)
+    results: dict[int, PurchaseEntryDefaults | Exception] = {}
+    for product_id in product_ids:
         try:
-            return ZoneInfo(tz_name)
-        except ZoneInfoNotFoundError:
-            logger.warning(
-                "Unknown timezone '%s' for instance %s", tz_name, instance_index
+            results[product_id] = manager.get_purchase_entry_defaults(
+                product_id, shopping_location_id
             )
+        except (MetadataNotFoundError, ValueError) as error:
+            results[product_id] = error
+    return results
+
+
+def _compose_purchase_timestamp(purchase_date: date, instance_index: str) -> int:
+    timezone = _instance_timezone(instance_index)
+    target_date = purchase_date or datetime.now(timezone).date()
+    return _midnight_epoch(target_date, timezone)
+
+
+# Purchases cluster on a handful of recent dates, and the epoch for a given
+# (date, timezone) never changes, so the tz/DST resolution is memoized.
+@lru_cache(maxsize=64)
+def _midnight_epoch(target_date: date, timezone: tzinfo) -> int:
+    # UTC midnight minus the zone's offset at local midnight; utcoffset on the
+    # naive wall time resolves DST gaps/folds exactly like datetime.timestamp().
+    local_midnight = datetime(target_date.year, target_date.month, target_date.day)
+    offset = timezone.utcoffset(local_midnight)
+    return calendar.timegm(target_date.timetuple()) - int(offset.total_seconds())
+
+
+def _instance_timezone(instance_index: str) -> tzinfo:
+    # The purchase has just resolved this manager, so this is a memo read on the
+    # loop; reading the zone from its client lets POST /reload refresh it.
+    timezone = governor.manager_for(instance_index).client.source_timezone()
+    if timezone is not None:
+        return timezone
     local_tz = datetime.now().astimezone().tzinfo
     if isinstance(local_tz, ZoneInfo):
         return local_tz
@@ -585,12 +670,12 @@ async def _ensure_shopping_location_id(
     if not normalized_name:
         return None
 
-    def _resolve_or_create() -> int:
+    def _resolve_or_create() -> GrocyShoppingLocation:
         manager = governor.manager_for(instance_index)
-        return manager.ensure_shopping_location(normalized_name).id
+        return manager.ensure_shopping_location(normalized_name)
 
     try:
-        return await run_in_threadpool(_resolve_or_create)
+        location = await run_in_threadpool(_resolve_or_create)
     except ValueError as error:
         raise HTTPException(status_code=400, detail=str(error)) from error
     except Exception as error:  # noqa: BLE001
@@ -600,6 +685,12 @@ async def _ensure_shopping_location_id(
         raise HTTPException(
             status_code=500, detail="Unable to resolve shopping location."
         ) from error
+    # Seed the Grist name lookup so a just-created location does not force the
+    # next name resolution to refetch every shopping location.
+    lookup = _shopping_location_names.get(instance_index)
+    if lookup is not None:
+        lookup[location.id] = location.name
+    return location.id
 
 
 async def _resolve_shopping_location_name(
@@ -607,6 +698,9 @@ async def _resolve_shopping_location_name(
 ) -> str | None:
     if shopping_location_id is None:
         return None
+    lookup = _shopping_location_names.get(instance_index)
+    if lookup is not None and shopping_location_id in lookup:
+        return lookup[shopping_location_id]
 
     def _fetch_locations() -> dict[int, str]:
         manager = governor.manager_for(instance_index)
@@ -614,11 +708,17 @@ async def _resolve_shopping_location_name(
             location.id: location.name for location in manager.list_shopping_locations()
         }
 
-    try:
-        lookup = await run_in_threadpool(_fetch_locations)
-    except Exception:  # noqa: BLE001
-        logger.exception(
-            "Failed to load shopping locations for instance %s", instance_index
-        )
-        return None
+    lock = _shopping_location_name_locks.setdefault(instance_index, asyncio.Lock())
+    async with lock:
+        lookup = _shopping_location_names.get(instance_index)
+        # An unknown id may be a location created since the last fetch.
+        if lookup is None or shopping_location_id not in lookup:
+            try:
+                lookup = await run_in_threadpool(_fetch_locations)
+            except Exception:  # noqa: BLE001
+                logger.exception(
+                    "Failed to load shopping locations for instance %s", instance_index
+                )
+                return None
+            _shopping_location_names[instance_index] = lookup
     return lookup.get(shopping_location_id)
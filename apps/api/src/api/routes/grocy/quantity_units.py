@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from core.grocy.exceptions import MetadataNotFoundError
+from functools import lru_cache
+from pathlib import Path
+
+from core.grocy.manager import GrocyManager
 from core.grocy.models import UniversalManifest
 from core.grocy.unit_conversions import (
     build_conversion_graph,
@@ -19,22 +22,15 @@ from models.grocy import (
 from .common import with_grocy_manager
 from .dependencies import governor, router
 
+_CONVERSIONS_FILE_NAME = "quantity_unit_conversions.json"
+
 
 @router.get(
     "/{instance_index}/quantity-units", response_model=GrocyQuantityUnitsResponse
 )
 async def list_quantity_units(instance_index: str) -> GrocyQuantityUnitsResponse:
     """Return Grocy quantity units for the requested instance."""
-
-    def _load_units():
-        return with_grocy_manager(
-            instance_index, lambda manager: manager.list_quantity_units()
-        )
-
-    try:
-        units = await run_in_threadpool(_load_units)
-    except MetadataNotFoundError as error:
-        raise HTTPException(status_code=404, detail=str(error)) from error
+    units = await with_grocy_manager(instance_index, GrocyManager.list_quantity_units)
 
     payload = [
         GrocyQuantityUnitPayload(
@@ -59,35 +55,44 @@ async def list_quantity_units(instance_index: str) -> GrocyQuantityUnitsResponse
 async def list_quantity_unit_conversions() -> GrocyQuantityUnitConversionsResponse:
     """Return a fully connected conversion map for universal quantity units."""
 
-    def _load_manifest():
-        return UniversalManifest.load(governor.manifest_root / "universal")
-
-    def _load_conversion_definitions():
-        conversions_path = (
-            governor.manifest_root / "universal" / "quantity_unit_conversions.json"
+    def _load_conversions() -> tuple[GrocyQuantityUnitConversionPayload, ...]:
+        universal_dir = governor.manifest_root / "universal"
+        return _build_conversion_payloads(
+            universal_dir,
+            (universal_dir / "quantity_units.json").stat().st_mtime_ns,
+            (universal_dir / _CONVERSIONS_FILE_NAME).stat().st_mtime_ns,
         )
-        return load_quantity_unit_conversions(conversions_path)
 
     try:
-        manifest = await run_in_threadpool(_load_manifest)
-        conversions = await run_in_threadpool(_load_conversion_definitions)
+        conversions = await run_in_threadpool(_load_conversions)
     except FileNotFoundError as error:
         raise HTTPException(status_code=500, detail=str(error)) from error
     except ValueError as error:
         raise HTTPException(status_code=400, detail=str(error)) from error
 
+    return GrocyQuantityUnitConversionsResponse(conversions=list(conversions))
+
+
+# The universal manifests only change on deploy or manual edits, so the graph
+# closure is rebuilt only when either file's mtime moves.
+@lru_cache(maxsize=1)
+def _build_conversion_payloads(
+    universal_dir: Path, units_mtime_ns: int, conversions_mtime_ns: int
+) -> tuple[GrocyQuantityUnitConversionPayload, ...]:
+    manifest = UniversalManifest.load(universal_dir)
+    conversions = load_quantity_unit_conversions(universal_dir / _CONVERSIONS_FILE_NAME)
     unit_name_lookup = {
         unit.normalized_name(): unit.name for unit in manifest.quantity_units
     }
     graph = build_conversion_graph(conversions, unit_name_lookup)
     conversion_map = build_full_conversion_map(graph)
-    payload = [
+    # build_conversion_graph only admits units present in unit_name_lookup, so
+    # every key resolves; a miss would be a graph bug and should raise.
+    return tuple(
         GrocyQuantityUnitConversionPayload(
             from_unit_name=unit_name_lookup[from_key],
             to_unit_name=unit_name_lookup[to_key],
             factor=factor,
         )
         for (from_key, to_key), factor in sorted(conversion_map.items())
-        if from_key in unit_name_lookup and to_key in unit_name_lookup
-    ]
-    return GrocyQuantityUnitConversionsResponse(conversions=payload)
+    )
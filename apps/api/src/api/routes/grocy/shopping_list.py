@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any
 
+from api.paths import SERVICE_ROOT
+from core.grocy.manager import GrocyManager
 from core.grocy.shopping_list_service import (
     ShoppingListGeneratorOptions,
     ShoppingListItemNotFoundError,
@@ -11,6 +15,7 @@ from core.grocy.shopping_list_service import (
     build_shopping_list_generator,
     build_shopping_list_manager,
 )
+from core.grocy.shopping_list_manager import ShoppingListManager
 from fastapi import HTTPException
 from fastapi.concurrency import run_in_threadpool
 from models.shopping_list import (
@@ -24,26 +29,47 @@ from models.shopping_list import (
 from models.shopping_list_remove import BulkRemoveRequest
 
 from .common import get_manager
-from .dependencies import SERVICE_ROOT, router
+from .dependencies import router
 
 # Shopping lists are stored in apps/api/shopping_lists
 SHOPPING_LISTS_ROOT = SERVICE_ROOT / "shopping_lists"
 logger = logging.getLogger(__name__)
+# The manager only holds the root path and serializes writes with per-instance
+# file locks, so one shared instance is safe across threadpool workers.
+_shopping_list_manager = build_shopping_list_manager(SHOPPING_LISTS_ROOT)
+_generate_locks: dict[str, asyncio.Lock] = {}
 
 
-def _get_manager():
-    """Get shopping list manager instance"""
-    return build_shopping_list_manager(SHOPPING_LISTS_ROOT)
+def _get_manager() -> ShoppingListManager:
+    """Get the shared shopping list manager instance"""
+    return _shopping_list_manager
 
 
+# Handlers below return the manager's dicts as-is; FastAPI validates and
+# serializes them once against response_model, so building models here would
+# validate every item twice.
 @router.post("/{instance_index}/shopping-list/generate", response_model=ShoppingList)
 async def generate_shopping_list(
     instance_index: str, request: GenerateListRequest
-) -> ShoppingList:
+) -> dict[str, Any]:
     """Generate shopping list with Phase 2 features (price, merge support)"""
+    # Resolve the instance first so an unknown index 404s without leaving a
+    # lock behind in _generate_locks.
+    grocy_manager = await get_manager(instance_index)
+    # Overlapping generate calls for one instance (e.g. two open tabs) would
+    # each rebuild the list and race on save_active_list; serialize them so a
+    # follower sees the leader's saved list and takes the 409/merge path.
+    lock = _generate_locks.setdefault(instance_index, asyncio.Lock())
+    async with lock:
+        return await _generate_shopping_list(instance_index, request, grocy_manager)
+
+
+async def _generate_shopping_list(
+    instance_index: str, request: GenerateListRequest, grocy_manager: GrocyManager
+) -> dict[str, Any]:
     manager = _get_manager()
 
-    if await run_in_threadpool(manager.active_list_exists, instance_index):
+    if manager.active_list_exists(instance_index):
         if not request.merge_with_existing:
             raise HTTPException(
                 status_code=409,
@@ -53,7 +79,6 @@ async def generate_shopping_list(
         existing_list = await run_in_threadpool(
             manager.load_active_list, instance_index
         )
-        grocy_manager = await get_manager(instance_index)
         options = ShoppingListGeneratorOptions(with_price_analyzer=True)
         try:
             generator = build_shopping_list_generator(grocy_manager, options)
@@ -63,9 +88,8 @@ async def generate_shopping_list(
             generator.merge_with_existing, existing_list, instance_index
         )
         await run_in_threadpool(manager.save_active_list, instance_index, merged_list)
-        return ShoppingList(**merged_list)
+        return merged_list
 
-    grocy_manager = await get_manager(instance_index)
     options = ShoppingListGeneratorOptions(with_price_analyzer=True)
     try:
         generator = build_shopping_list_generator(grocy_manager, options)
@@ -75,19 +99,22 @@ async def generate_shopping_list(
 
     await run_in_threadpool(manager.save_active_list, instance_index, list_data)
 
-    return ShoppingList(**list_data)
+    return list_data
 
 
 @router.get(
     "/{instance_index}/shopping-list/active", response_model=ShoppingList | None
 )
-async def get_active_list(instance_index: str) -> ShoppingList | None:
+async def get_active_list(instance_index: str) -> dict[str, Any] | None:
     """Get the current active shopping list, or null if none exists"""
     manager = _get_manager()
+    # Answer the no-active-list case without a threadpool hop.
+    if not manager.active_list_exists(instance_index):
+        return None
 
     try:
         list_data = await run_in_threadpool(manager.load_active_list, instance_index)
-        return ShoppingList(**list_data)
+        return list_data
     except FileNotFoundError:
         return None
 
@@ -120,7 +147,7 @@ async def complete_shopping_list(instance_index: str) -> dict[str, str]:
 async def add_item(
     instance_index: str,
     request: AddItemRequest,
-) -> ShoppingListItem:
+) -> dict[str, Any]:
     """Add a new item to the active shopping list"""
     manager = _get_manager()
 
@@ -132,7 +159,7 @@ async def add_item(
         added_items = await run_in_threadpool(
             manager.add_items_bulk, instance_index, items_data
         )
-        return ShoppingListItem(**added_items[0])
+        return added_items[0]
     except FileNotFoundError as exc:
         raise HTTPException(
             status_code=404,
@@ -153,8 +180,13 @@ def _serialize_updates(updates: list[BulkItemUpdate]) -> list[dict]:
 
     Using exclude_unset avoids sending implicit null shopping_location fields during status-only
     updates, which previously cleared locations and pushed items into the UNKNOWN section.
+    BulkItemUpdate fields are all scalars, so reading the set fields directly matches
+    model_dump(exclude_unset=True) without its per-item serializer pass.
     """
-    return [update.model_dump(exclude_unset=True) for update in updates]
+    return [
+        {field: getattr(update, field) for field in update.model_fields_set}
+        for update in updates
+    ]
 
 
 @router.patch(
@@ -164,7 +196,7 @@ def _serialize_updates(updates: list[BulkItemUpdate]) -> list[dict]:
 async def bulk_update_items(
     instance_index: str,
     request: BulkUpdateRequest,
-) -> list[ShoppingListItem]:
+) -> list[dict[str, Any]]:
     """Update multiple shopping list items in a single request
 
     This endpoint allows updating multiple items at once, which is more efficient
@@ -197,7 +229,7 @@ async def bulk_update_items(
             updates_dict,
         )
 
-        return [ShoppingListItem(**item) for item in updated_items]
+        return updated_items
     except FileNotFoundError as exc:
         raise HTTPException(
             status_code=404,
@@ -216,7 +248,7 @@ async def bulk_update_items(
 async def bulk_add_items(
     instance_index: str,
     requests: list[AddItemRequest],
-) -> list[ShoppingListItem]:
+) -> list[dict[str, Any]]:
     """Add multiple items to the active shopping list (Design for N)."""
     manager = _get_manager()
 
@@ -228,13 +260,11 @@ async def bulk_add_items(
         added_items = await run_in_threadpool(
             manager.add_items_bulk, instance_index, item_payloads
         )
-        shopping_list_items = [ShoppingListItem(**item) for item in added_items]
-
         logger.info(
             "shopping_list_bulk_add",
-            extra={"instance_index": instance_index, "count": len(shopping_list_items)},
+            extra={"instance_index": instance_index, "count": len(added_items)},
         )
-        return shopping_list_items
+        return added_items
     except FileNotFoundError as exc:
         raise HTTPException(
             status_code=404,
@@ -256,7 +286,7 @@ async def bulk_add_items(
 async def bulk_remove_items(
     instance_index: str,
     request: BulkRemoveRequest,
-) -> list[ShoppingListItem]:
+) -> list[dict[str, Any]]:
     """Remove multiple items from the active shopping list."""
     manager = _get_manager()
 
@@ -268,7 +298,7 @@ async def bulk_remove_items(
             "shopping_list_bulk_remove",
             extra={"instance_index": instance_index, "count": len(removed)},
         )
-        return [ShoppingListItem(**item) for item in removed]
+        return removed
     except FileNotFoundError as exc:
         raise HTTPException(
             status_code=404,
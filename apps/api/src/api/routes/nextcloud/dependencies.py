@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from pathlib import Path
-
+from api.paths import SERVICE_ROOT
 from core.nextcloud import (
     NextcloudCredentialsRepository,
     NextcloudGovernor,
@@ -11,8 +10,6 @@ from fastapi import APIRouter
 
 router = APIRouter(prefix="/nextcloud", tags=["nextcloud"])
 
-# Resolve the service root (apps/api) that contains src/ and nextcloud_manifest/.
-SERVICE_ROOT = Path(__file__).resolve().parents[4]
 MANIFEST_ROOT = SERVICE_ROOT / "nextcloud_manifest"
 
 metadata_repository = NextcloudMetadataRepository(MANIFEST_ROOT)
@@ -2,12 +2,15 @@ import asyncio
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import AsyncIterator
 
+import anyio.to_thread
 import uvicorn
+from api.paths import SERVICE_ROOT
 from api.routes import grist, grocy, medusa
 from bot import BOT_ENABLED, TELEGRAM_INQURY_GROUP_CHAT_ID, telegram_app
 from cachetools import TTLCache
@@ -27,8 +30,10 @@ from core.nextcloud.validation import (
     NextcloudManifestValidationConfig,
     validate_nextcloud_manifests,
 )
+from core.thread_pool import resolve_thread_pool_size
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
 from flet.fastapi import app as flet_fastapi
 from flet_app import main as flet_main
@@ -41,6 +46,7 @@ from services.weather.config import (
 from services.weather.job import WeatherIngestJob
 from services.weather.utils import seconds_until_next_run
 from setup import initialize_server
+from shared.grist_service import close_grist_http_client
 from telegram.ext import Application
 
 initialize_server()
@@ -53,8 +59,6 @@ logging.basicConfig(
 
 DEV_MODE: bool = os.getenv("FASTAPI_ENV", "").lower() in {"dev", "development"}
 
-SERVICE_ROOT = Path(__file__).resolve().parents[1]
-
 
 def _require_telegram_app() -> Application:
     if telegram_app is None:
@@ -62,6 +66,20 @@ def _require_telegram_app() -> Application:
     return telegram_app
 
 
+def _configure_thread_pools() -> None:
+    """Size the run_in_threadpool limiter and asyncio.to_thread executor alike.
+
+    Grocy, Grist, and shopping-list handlers offload blocking I/O to threads, and
+    anyio's default 40-token limiter caps run_in_threadpool concurrency across the
+    whole process. Sized per uvicorn worker.
+    """
+    thread_pool_size = resolve_thread_pool_size()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = thread_pool_size
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=thread_pool_size)
+    )
+
+
 def _validate_nextcloud_manifests() -> None:
     manifest_root = SERVICE_ROOT / "nextcloud_manifest"
     metadata_repository = NextcloudMetadataRepository(manifest_root)
@@ -77,6 +95,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     bot_started = False
     bot_task: asyncio.Task[None] | None = None
 
+    _configure_thread_pools()
     _validate_nextcloud_manifests()
 
     if not BOT_ENABLED or DEV_MODE:
@@ -125,6 +144,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         #         logging.info("Weather ingest scheduler cancelled during shutdown.")
         await tandoor_cache_refresher.stop()
         await grist_cache_refresher.stop()
+        await close_grist_http_client()
         if bot_started:
             bot_app = _require_telegram_app()
             await bot_app.updater.stop()
@@ -140,6 +160,9 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
 )
+# Product listings repeat unit names and metadata across many rows and compress
+# well; small responses are left untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 validation_error_cache = TTLCache(maxsize=1000, ttl=600)
 
@@ -270,4 +293,6 @@ async def health_check() -> dict[str, str]:
 if __name__ == "__main__":
     logging.info("Starting FastAPI server...")
     logging.info("Flet app available at: http://localhost:6969/flet")
-    uvicorn.run(app, host="0.0.0.0", port=6969)
+    # Single worker: the Telegram poller, cache refreshers, and Grocy managers
+    # are per-process state that must not be duplicated.
+    uvicorn.run(app, host="0.0.0.0", port=6969, loop="uvloop", http="httptools")
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
 import os
+from functools import cache
 
 _DEFAULT_INSTANCE_KEY = "000000"
-
-
+# Every inquiry goes to one group chat, so Telegram's per-chat limits apply
+# (about 1 message/second, 20 messages/minute in groups), not the global one.
+TELEGRAM_GROUP_SEND_INTERVAL_SECONDS = 3.0
+# A RetryAfter (429) is retried after the delay Telegram asks for and a network
+# error after the backoff below, this many attempts per message in total.
+TELEGRAM_SEND_MAX_ATTEMPTS = 3
+# Failed CalDAV creates are retried this many attempts per event in total; the
+# event UID is fixed, so a retried PUT cannot create a duplicate.
+NEXTCLOUD_CREATE_MAX_ATTEMPTS = 3
+NOTIFICATION_RETRY_BACKOFF_SECONDS = 2.0
+
+
+# Environment is fixed for the process lifetime, so resolve each key once.
+@cache
 def resolve_medusa_instance_key() -> str:
     value = os.getenv("MEDUSA_DEFAULT_INSTANCE_KEY")
     return _normalize_instance_key(value)
 
 
+@cache
 def resolve_nextcloud_instance_key() -> str:
     value = os.getenv("NEXTCLOUD_DEFAULT_INSTANCE_KEY")
     return _normalize_instance_key(value)
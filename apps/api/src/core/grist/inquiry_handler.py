@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any, Protocol
 
 import requests
+from caldav.lib.error import DAVError
 from core.cache.grist_inquiry_idempotency import (
     GristInquiryIdempotencyStore,
     build_inquiry_idempotency_key,
 )
 from core.grist.config import (
+    NEXTCLOUD_CREATE_MAX_ATTEMPTS,
+    NOTIFICATION_RETRY_BACKOFF_SECONDS,
+    TELEGRAM_GROUP_SEND_INTERVAL_SECONDS,
+    TELEGRAM_SEND_MAX_ATTEMPTS,
     resolve_medusa_instance_key,
     resolve_nextcloud_instance_key,
 )
 from core.grist.exceptions import MedusaOrderFetchError
+from core.grist.rate_limit import MinIntervalRateLimiter
 from core.grist.telegram import build_inquiry_message
 from core.medusa.exceptions import MedusaMetadataNotFoundError
 from core.medusa.governor import MedusaGovernor
@@ -21,35 +28,57 @@ from core.medusa.orders import fetch_orders
 from core.nextcloud.client import NextcloudCalendarClient
 from core.nextcloud.events import NextcloudCalendarEvent, build_order_calendar_event
 from core.nextcloud.governor import NextcloudGovernor
-from models.customer_inquiry_model import Inquiries
+from fastapi.concurrency import run_in_threadpool
+from models.customer_inquiry_model import Inquiries, Inquiry
 from models.medusa.order_response import MedusaOrderResponse
+from telegram.error import NetworkError, RetryAfter
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+)
 
 logger = logging.getLogger(__name__)
 
+# Shared by every dispatch so concurrent webhooks still respect the chat limit.
+_telegram_send_rate_limiter = MinIntervalRateLimiter(
+    TELEGRAM_GROUP_SEND_INTERVAL_SECONDS
+)
+
 
 class TelegramSender(Protocol):
     async def send_message(self, chat_id: int, text: str, parse_mode: str) -> Any: ...
 
 
-async def handle_inquiries(
+@dataclass(frozen=True)
+class InquiryDispatch:
+    """Notifications resolved for a webhook batch, ready to be delivered."""
+
+    messages: list[tuple[str, int, datetime, str]]
+    calendar_events: list[tuple[str, int, datetime, NextcloudCalendarEvent]]
+    nextcloud_client: NextcloudCalendarClient | None
+    nextcloud_instance_key: str | None
+
+
+async def prepare_inquiries(
     inquiries: Inquiries,
     now: datetime,
     medusa_governor: MedusaGovernor,
     nextcloud_governor: NextcloudGovernor,
     idempotency_store: GristInquiryIdempotencyStore,
-    telegram_sender: TelegramSender | None,
-    telegram_chat_id: int,
-    bot_enabled: bool,
-) -> int:
+) -> InquiryDispatch:
+    """Fetch orders, resolve idempotency state, and build pending notifications."""
     messages: list[tuple[str, int, datetime, str]] = []
     calendar_events: list[tuple[str, int, datetime, NextcloudCalendarEvent]] = []
-    order_ids = [
-        inquiry.medusa_order_id for inquiry in inquiries.root if inquiry.medusa_order_id
-    ]
-    order_ids = list(dict.fromkeys(order_ids))
+    order_ids: list[str] = []
+    seen_order_ids: set[str] = set()
+    for inquiry in inquiries.root:
+        order_id = inquiry.medusa_order_id
+        if order_id and order_id not in seen_order_ids:
+            seen_order_ids.add(order_id)
+            order_ids.append(order_id)
     order_payloads: dict[str, MedusaOrderResponse] = {}
-    nextcloud_client: NextcloudCalendarClient | None = None
-    nextcloud_instance_key: str | None = None
 
     if order_ids:
         instance_key = resolve_medusa_instance_key()
@@ -64,13 +93,21 @@ async def handle_inquiries(
             logger.exception("Failed to fetch Medusa orders for %s", instance_key)
             raise MedusaOrderFetchError(instance_key) from exc
 
-    for inquiry in inquiries.root:
-        idempotency_key = build_inquiry_idempotency_key(inquiry)
-        record = idempotency_store.get_or_create(
-            idempotency_key, inquiry.id, inquiry.last_updated, now
+    # Calendar events are only built for inquiries backed by a fetched order.
+    nextcloud_client: NextcloudCalendarClient | None = None
+    nextcloud_instance_key: str | None = None
+    if order_payloads:
+        nextcloud_client, nextcloud_instance_key = _try_init_nextcloud(
+            nextcloud_governor
         )
-        telegram_pending = record.telegram_sent_at is None
-        nextcloud_pending = record.nextcloud_event_uid is None
+
+    # The store is blocking I/O; resolve every inquiry in a single worker hop.
+    pending_states = await run_in_threadpool(
+        _load_pending_states, inquiries.root, idempotency_store, now
+    )
+    for inquiry, (idempotency_key, telegram_pending, nextcloud_pending) in zip(
+        inquiries.root, pending_states
+    ):
         if not telegram_pending and not nextcloud_pending:
             logger.info(
                 "Skipping inquiry %s due to idempotency key %s",
@@ -89,24 +126,11 @@ async def handle_inquiries(
                 (idempotency_key, inquiry.id, inquiry.last_updated, message_text)
             )
 
-        if nextcloud_pending and order_response is not None:
-            if nextcloud_client is None:
-                nextcloud_instance_key = resolve_nextcloud_instance_key()
-                try:
-                    nextcloud_client = nextcloud_governor.client_for(
-                        nextcloud_instance_key
-                    )
-                except (FileNotFoundError, ValueError, RuntimeError):
-                    logger.exception(
-                        "Failed to initialize Nextcloud client for %s",
-                        nextcloud_instance_key,
-                    )
-                    nextcloud_client = None
-                    nextcloud_instance_key = None
-                    logger.info(
-                        "Skipping Nextcloud event creation for inquiry %s", inquiry.id
-                    )
-                    continue
+        if (
+            nextcloud_pending
+            and order_response is not None
+            and nextcloud_client is not None
+        ):
             calendar_event = build_order_calendar_event(
                 inquiry,
                 order_response,
@@ -117,44 +141,193 @@ async def handle_inquiries(
                 (idempotency_key, inquiry.id, inquiry.last_updated, calendar_event)
             )
 
+    return InquiryDispatch(
+        messages=messages,
+        calendar_events=calendar_events,
+        nextcloud_client=nextcloud_client,
+        nextcloud_instance_key=nextcloud_instance_key,
+    )
+
+
+async def dispatch_inquiries(
+    dispatch: InquiryDispatch,
+    idempotency_store: GristInquiryIdempotencyStore,
+    telegram_sender: TelegramSender | None,
+    telegram_chat_id: int,
+    bot_enabled: bool,
+) -> None:
+    """Deliver prepared notifications; runs after the webhook has been acknowledged.
+
+    Each send and calendar create is retried a bounded number of times. Anything
+    still failing after that, or lost because the process restarted before this
+    task ran, is only logged and is not redelivered: the webhook was already
+    answered with a 202, so Grist will not resend it. The unmarked idempotency
+    rows only let a later webhook for the same inquiry pick the work up again.
+    """
     if bot_enabled and telegram_sender is not None:
-        for idempotency_key, inquiry_id, updated_at, message in messages:
-            await telegram_sender.send_message(
-                chat_id=telegram_chat_id,
-                text=message,
-                parse_mode="MarkdownV2",
-            )
-            idempotency_store.mark_telegram_sent(
-                idempotency_key, inquiry_id, updated_at, datetime.now(UTC)
-            )
+        await _send_telegram_messages(
+            dispatch.messages, telegram_sender, telegram_chat_id, idempotency_store
+        )
     else:
         logger.info(
-            "Telegram bot disabled; skipping %d inquiry notifications.", len(messages)
+            "Telegram bot disabled; skipping %d inquiry notifications.",
+            len(dispatch.messages),
+        )
+
+    if dispatch.calendar_events and dispatch.nextcloud_client is not None:
+        await run_in_threadpool(
+            _create_calendar_events,
+            dispatch.calendar_events,
+            dispatch.nextcloud_client,
+            dispatch.nextcloud_instance_key,
+            idempotency_store,
+        )
+
+
+async def _send_telegram_messages(
+    messages: list[tuple[str, int, datetime, str]],
+    telegram_sender: TelegramSender,
+    telegram_chat_id: int,
+    idempotency_store: GristInquiryIdempotencyStore,
+) -> None:
+    # Sequential so inquiries post to the group in the order they arrived.
+    sent: list[tuple[str, int, datetime]] = []
+    for idempotency_key, inquiry_id, updated_at, message in messages:
+        try:
+            await _send_telegram_message(telegram_sender, telegram_chat_id, message)
+        except Exception:
+            logger.exception(
+                "Failed to send Telegram notification for inquiry %s", inquiry_id
+            )
+            continue
+        sent.append((idempotency_key, inquiry_id, updated_at))
+    # Failed sends stay unmarked and are not retried again by this process.
+    try:
+        await run_in_threadpool(_mark_telegram_sent, sent, idempotency_store)
+    except Exception:
+        # The messages were delivered; a later webhook for these inquiries
+        # would send them again, but calendar creation must still run.
+        logger.exception(
+            "Failed to record Telegram delivery for %d inquiries", len(sent)
         )
 
-    if calendar_events and nextcloud_client is not None:
+
+def _wait_before_retry(retry_state: RetryCallState) -> float:
+    error = retry_state.outcome.exception()
+    if not isinstance(error, RetryAfter):
+        return NOTIFICATION_RETRY_BACKOFF_SECONDS
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+# NetworkError covers TimedOut; other Telegram errors (bad request, forbidden)
+# would fail the same way again.
+@retry(
+    retry=retry_if_exception_type((RetryAfter, NetworkError)),
+    wait=_wait_before_retry,
+    stop=stop_after_attempt(TELEGRAM_SEND_MAX_ATTEMPTS),
+    reraise=True,
+)
+async def _send_telegram_message(
+    telegram_sender: TelegramSender, telegram_chat_id: int, message: str
+) -> None:
+    await _telegram_send_rate_limiter.wait()
+    await telegram_sender.send_message(
+        chat_id=telegram_chat_id,
+        text=message,
+        parse_mode="MarkdownV2",
+    )
+
+
+def _try_init_nextcloud(
+    nextcloud_governor: NextcloudGovernor,
+) -> tuple[NextcloudCalendarClient | None, str | None]:
+    nextcloud_instance_key = resolve_nextcloud_instance_key()
+    try:
+        return (
+            nextcloud_governor.client_for(nextcloud_instance_key),
+            nextcloud_instance_key,
+        )
+    except (FileNotFoundError, ValueError, RuntimeError):
+        logger.exception(
+            "Failed to initialize Nextcloud client for %s",
+            nextcloud_instance_key,
+        )
+        logger.info("Skipping Nextcloud event creation for this batch")
+        return None, None
+
+
+def _load_pending_states(
+    inquiries: list[Inquiry],
+    idempotency_store: GristInquiryIdempotencyStore,
+    now: datetime,
+) -> list[tuple[str, bool, bool]]:
+    """Return (idempotency_key, telegram_pending, nextcloud_pending) per inquiry."""
+    states: list[tuple[str, bool, bool]] = []
+    for inquiry in inquiries:
+        idempotency_key = build_inquiry_idempotency_key(inquiry)
+        record = idempotency_store.get_or_create(
+            idempotency_key, inquiry.id, inquiry.last_updated, now
+        )
+        states.append(
+            (
+                idempotency_key,
+                record.telegram_sent_at is None,
+                record.nextcloud_event_uid is None,
+            )
+        )
+    return states
+
+
+def _mark_telegram_sent(
+    sent: list[tuple[str, int, datetime]],
+    idempotency_store: GristInquiryIdempotencyStore,
+) -> None:
+    sent_at = datetime.now(UTC)
+    for idempotency_key, inquiry_id, updated_at in sent:
+        idempotency_store.mark_telegram_sent(
+            idempotency_key, inquiry_id, updated_at, sent_at
+        )
+
+
+def _create_calendar_events(
+    calendar_events: list[tuple[str, int, datetime, NextcloudCalendarEvent]],
+    nextcloud_client: NextcloudCalendarClient,
+    nextcloud_instance_key: str | None,
+    idempotency_store: GristInquiryIdempotencyStore,
+) -> None:
+    # Each event is created and marked on its own, so one failure neither skips
+    # the remaining events nor leaves already-created ones unmarked.
+    for idempotency_key, inquiry_id, updated_at, calendar_event in calendar_events:
         try:
-            for (
+            _create_calendar_event(nextcloud_client, calendar_event)
+            idempotency_store.mark_nextcloud_created(
                 idempotency_key,
                 inquiry_id,
                 updated_at,
-                calendar_event,
-            ) in calendar_events:
-                nextcloud_client.create_events([calendar_event])
-                idempotency_store.mark_nextcloud_created(
-                    idempotency_key,
-                    inquiry_id,
-                    updated_at,
-                    calendar_event.uid,
-                    datetime.now(UTC),
-                )
+                calendar_event.uid,
+                datetime.now(UTC),
+            )
         except Exception:
             logger.exception(
-                "Failed to create Nextcloud events for %s",
+                "Failed to create Nextcloud event for inquiry %s on %s",
+                inquiry_id,
                 nextcloud_instance_key,
             )
-            logger.info(
-                "Continuing after Nextcloud failure; Telegram notifications already sent."
-            )
 
-    return len(messages)
+
+# DAVError covers rejected requests; connection and timeout errors from the HTTP
+# layer are OSErrors.
+@retry(
+    retry=retry_if_exception_type((DAVError, OSError)),
+    wait=_wait_before_retry,
+    stop=stop_after_attempt(NEXTCLOUD_CREATE_MAX_ATTEMPTS),
+    reraise=True,
+)
+def _create_calendar_event(
+    nextcloud_client: NextcloudCalendarClient,
+    calendar_event: NextcloudCalendarEvent,
+) -> None:
+    nextcloud_client.create_event(calendar_event)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+
+
+class MinIntervalRateLimiter:
+    """Space callers at least ``interval_seconds`` apart on the running loop.
+
+    Each caller reserves the next free slot synchronously before sleeping, so
+    concurrent waiters are released in arrival order without a lock.
+    """
+
+    def __init__(self, interval_seconds: float) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive.")
+        self._interval_seconds = interval_seconds
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        """Sleep until this caller's reserved slot."""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval_seconds
+        if slot > now:
+            await asyncio.sleep(slot - now)
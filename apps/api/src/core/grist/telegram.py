@@ -1,89 +1,78 @@
 from __future__ import annotations
 
-from models.customer_inquiry_model import Inquiry, format_phone_number
+from core.grist.markdown import escape_markdown_v2
+from models.customer_inquiry_model import (
+    Inquiry,
+    PreferredContactMethod,
+    format_phone_number,
+)
 from models.medusa.order_response import MedusaOrderResponse
 
-MARKDOWN_V2_SPECIAL_CHARACTERS = set(
-    "\\_*[]()~`>#+-=|{}.!"
-)  # Telegram Markdown V2 reserved characters.
 PREFERRED_SUFFIX = (
     " _\\(Preferred\\)_"  # Italicised "(Preferred)" with escaped parentheses.
 )
-
-
-def escape_markdown_v2(value: str) -> str:
-    """Escape Telegram MarkdownV2-reserved characters within the provided text."""
-    escaped_characters: list[str] = []
-
-    for character in value:
-        if character in MARKDOWN_V2_SPECIAL_CHARACTERS:
-            escaped_characters.append(f"\\{character}")
-        else:
-            escaped_characters.append(character)
-
-    return "".join(escaped_characters)
+_EMAIL_LINE = "📧 *Email:* {email}"
+_PHONE_LINE = "📞 *Phone:* {phone}"
+_CONTACT_INFO_TEMPLATES: dict[PreferredContactMethod | None, str] = {
+    PreferredContactMethod.EMAIL: f"{_EMAIL_LINE}{PREFERRED_SUFFIX}\n{_PHONE_LINE}",
+    PreferredContactMethod.TEXT: f"{_PHONE_LINE}{PREFERRED_SUFFIX}\n{_EMAIL_LINE}",
+    None: f"{_PHONE_LINE}\n{_EMAIL_LINE}",
+}
 
 
 def format_medusa_order_summary(
     order_id: str, order_response: MedusaOrderResponse | None
 ) -> str:
-    safe_order_id = escape_markdown_v2(order_id)
-    summary_lines = [f"🧾 *Medusa Order ID:* {safe_order_id}"]
+    header = f"🧾 *Medusa Order ID:* {escape_markdown_v2(order_id)}"
     if not order_response:
-        return "\n".join(summary_lines)
+        return header
 
     order = order_response.order
-
     display_id = order.display_id
     status_value = order.status
-    email_value = getattr(order, "email", None)
+    email_value = order.email
     total_value = order.total
-    currency_value = getattr(order, "currency_code", None)
+    currency_value = order.currency_code
 
-    if display_id is not None:
-        summary_lines.append(
-            f"🔢 *Order Number:* {escape_markdown_v2(str(display_id))}"
+    return (
+        header
+        + (
+            f"\n🔢 *Order Number:* {escape_markdown_v2(str(display_id))}"
+            if display_id is not None
+            else ""
         )
-    if status_value:
-        summary_lines.append(
-            f"✅ *Order Status:* {escape_markdown_v2(str(status_value))}"
+        + (
+            f"\n✅ *Order Status:* {escape_markdown_v2(str(status_value))}"
+            if status_value
+            else ""
         )
-    if email_value:
-        summary_lines.append(
-            f"📧 *Order Email:* {escape_markdown_v2(str(email_value))}"
+        + (
+            f"\n📧 *Order Email:* {escape_markdown_v2(str(email_value))}"
+            if email_value
+            else ""
         )
-    if total_value is not None and currency_value:
-        summary_lines.append(
-            "💵 *Order Total:* "
+        + (
+            "\n💵 *Order Total:* "
             f"{escape_markdown_v2(str(total_value))} "
             f"{escape_markdown_v2(str(currency_value).upper())}"
+            if total_value is not None and currency_value
+            else ""
         )
-
-    return "\n".join(summary_lines)
+    )
 
 
 def build_inquiry_message(
     inquiry: Inquiry, order_response: MedusaOrderResponse | None
 ) -> str:
     email_value = (
-        escape_markdown_v2(inquiry.email.ascii_email)
-        if getattr(inquiry, "email", None)
-        else "N/A"
+        escape_markdown_v2(inquiry.email.ascii_email) if inquiry.email else "N/A"
     )
     formatted_phone = format_phone_number(inquiry.phone_number)
     phone_value = escape_markdown_v2(formatted_phone) if formatted_phone else "N/A"
 
-    email_line = f"📧 *Email:* {email_value}"
-    phone_line = f"📞 *Phone:* {phone_value}"
-
-    if inquiry.preferred_contact_method:
-        preferred_contact = inquiry.preferred_contact_method.value
-        if preferred_contact == "email":
-            contact_info = f"{email_line}{PREFERRED_SUFFIX}\n{phone_line}"
-        else:
-            contact_info = f"{phone_line}{PREFERRED_SUFFIX}\n{email_line}"
-    else:
-        contact_info = f"{phone_line}\n{email_line}"
+    contact_info = _CONTACT_INFO_TEMPLATES[inquiry.preferred_contact_method].format(
+        email=email_value, phone=phone_value
+    )
 
     customer_names = [
         name
@@ -100,7 +89,12 @@ def build_inquiry_message(
     )
     inquiry_message = escape_markdown_v2(inquiry.inquiry or "N/A")
     needed_by = (
-        escape_markdown_v2(inquiry.date_needed_by.strftime("%Y-%m-%d %H:%M:%S"))
+        # Drop tzinfo so isoformat omits the offset, matching "%Y-%m-%d %H:%M:%S".
+        escape_markdown_v2(
+            inquiry.date_needed_by.replace(tzinfo=None).isoformat(
+                sep=" ", timespec="seconds"
+            )
+        )
         if inquiry.date_needed_by
         else "N/A"
     )
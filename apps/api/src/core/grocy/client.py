@@ -24,6 +24,7 @@ from core.grocy.responses import (
     parse_stock_entries,
     parse_stock_log_entries,
 )
+from core.thread_pool import resolve_thread_pool_size
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
@@ -43,12 +44,21 @@ class GrocyClient:
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
         self.session.headers.update({"GROCY-API-KEY": api_key})
-        adapter = HTTPAdapter(max_retries=_build_retry_strategy())
+        # Routes call the client from the worker threadpool (THREAD_POOL_SIZE); a
+        # smaller pool would discard connections instead of keeping them alive.
+        adapter = HTTPAdapter(
+            max_retries=_build_retry_strategy(),
+            pool_maxsize=resolve_thread_pool_size(),
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         self._source_timezone = _coerce_timezone(instance_timezone)
         self._request_timeout = _DEFAULT_REQUEST_TIMEOUT_SECONDS
 
+    def source_timezone(self) -> tzinfo | None:
+        """Return the instance timezone configured in metadata, if any."""
+        return self._source_timezone
+
     def list_quantity_units(self) -> list[GrocyQuantityUnit]:
         """Return the list of quantity units already present in Grocy."""
         payload = self._request("GET", "/api/objects/quantity_units", None)
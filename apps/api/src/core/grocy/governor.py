@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from threading import Lock
 from typing import Dict
 
 from core.grocy.client import GrocyClient
@@ -29,6 +30,9 @@ class GrocyGovernor:
         self.credentials_repository = credentials_repository
         self.manifest_root = manifest_root
         self._managers: Dict[str, GrocyManager] = {}
+        # Routes resolve managers from threadpool workers; serialize first-time
+        # construction so concurrent requests share one manager and its caches.
+        self._managers_lock = Lock()
 
     def available_instances(self) -> list[str]:
         """Return indexes that can be governed."""
@@ -36,21 +40,26 @@ class GrocyGovernor:
 
     def manager_for(self, instance_index: str) -> GrocyManager:
         """Return a GrocyManager for the requested instance, creating it if necessary."""
-        if instance_index in self._managers:
-            return self._managers[instance_index]
-        metadata = self.metadata_repository.load(instance_index)
-        credentials = self.credentials_repository.load(instance_index)
-        client = GrocyClient(
-            metadata.grocy_url, credentials.api_key, metadata.instance_timezone
-        )
-        manager = GrocyManager(instance_index, client)
-        self._managers[instance_index] = manager
-        return manager
+        manager = self._managers.get(instance_index)
+        if manager is not None:
+            return manager
+        with self._managers_lock:
+            manager = self._managers.get(instance_index)
+            if manager is not None:
+                return manager
+            metadata = self.metadata_repository.load(instance_index)
+            credentials = self.credentials_repository.load(instance_index)
+            client = GrocyClient(
+                metadata.grocy_url, credentials.api_key, metadata.instance_timezone
+            )
+            manager = GrocyManager(instance_index, client)
+            self._managers[instance_index] = manager
+            return manager
 
-    def clear_manager(self, instance_index: str) -> None:
+    def clear_manager(self, instance_index: str) -> bool:
         """Remove a cached manager so future calls reload metadata and clients."""
-        if instance_index in self._managers:
-            del self._managers[instance_index]
+        with self._managers_lock:
+            return self._managers.pop(instance_index, None) is not None
 
     def list_instances_with_metadata(self) -> list[tuple[str, InstanceMetadata]]:
         """Return metadata for every known Grocy instance."""
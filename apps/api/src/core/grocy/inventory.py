@@ -306,7 +306,6 @@ class ProductInventoryService:
         _shopping_location_id: int | None,
     ) -> PurchaseEntryDefaults:
         """Return default metadata used to pre-populate purchase entries."""
-        self._get_product(instance_index, product_id)
         return build_purchase_defaults(self._get_product(instance_index, product_id))
 
     def invalidate_inventory_caches(self, instance_index: str) -> None:
@@ -6,8 +6,11 @@ import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any, ClassVar, Mapping, Sequence
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 NOTE_PREFIX = "kanomnom::"
@@ -427,18 +430,20 @@ def normalize_product_description_metadata(
             raise ValueError(
                 "Unit conversions must include from_unit and to_unit names."
             )
-        if from_key not in unit_name_lookup:
+        from_name = unit_name_lookup.get(from_key)
+        if from_name is None:
             raise ValueError(f"Unknown Grocy quantity unit '{conversion.from_unit}'.")
-        if to_key not in unit_name_lookup:
+        to_name = unit_name_lookup.get(to_key)
+        if to_name is None:
             raise ValueError(f"Unknown Grocy quantity unit '{conversion.to_unit}'.")
-        pair_key = tuple(sorted((from_key, to_key)))
+        pair_key = (from_key, to_key) if from_key <= to_key else (to_key, from_key)
         if pair_key in seen_pairs:
             continue
         seen_pairs.add(pair_key)
         sanitized.append(
             ProductUnitConversion(
-                from_unit=unit_name_lookup[from_key],
-                to_unit=unit_name_lookup[to_key],
+                from_unit=from_name,
+                to_unit=to_name,
                 factor=conversion.factor,
                 tare=conversion.tare,
             )
@@ -479,6 +484,9 @@ def resolve_unit_conversion_factors(
     return results
 
 
+# Unit names repeat across conversion rows and batch updates; caching the whole
+# call (None included) beats re-running strip/lower on each lookup.
+@lru_cache(maxsize=2048)
 def _normalize_unit_name(value: str | None) -> str:
     if value is None:
         return ""
@@ -652,8 +660,8 @@ def decode_structured_note(raw: str | None) -> DecodedGrocyNote:
         return DecodedGrocyNote(note=cleaned, metadata=None)
     payload_raw = raw[len(NOTE_PREFIX) :]
     try:
-        payload = json.loads(payload_raw)
-    except json.JSONDecodeError:
+        payload = orjson.loads(payload_raw)
+    except orjson.JSONDecodeError:
         logger.warning("Failed to decode structured Grocy note; returning raw text.")
         return DecodedGrocyNote(note=raw, metadata=None)
 
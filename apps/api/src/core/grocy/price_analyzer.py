@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from core.grocy.client import GrocyClient
+from core.grocy.responses import GrocyStockLogEntry
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,7 @@ class PriceAnalyzer:
         self.grocy_client = grocy_client
         self._stock_log_cache: list | None = None
         self._shopping_locations_cache: list | None = None
+        self._latest_purchases_cache: dict[int, GrocyStockLogEntry] | None = None
 
     def _get_stock_log(self) -> list:
         """Fetch stock log once per analyzer instance."""
@@ -21,6 +23,14 @@ class PriceAnalyzer:
             self._stock_log_cache = self.grocy_client.list_stock_log()
         return self._stock_log_cache
 
+    def _get_latest_purchases(self) -> dict[int, GrocyStockLogEntry]:
+        """Index the most recent purchase per product once per analyzer instance."""
+        if self._latest_purchases_cache is None:
+            self._latest_purchases_cache = _index_latest_purchases(
+                self._get_stock_log()
+            )
+        return self._latest_purchases_cache
+
     def _get_shopping_locations(self) -> list:
         """Fetch shopping locations once per analyzer instance."""
         if self._shopping_locations_cache is None:
@@ -37,27 +47,17 @@ class PriceAnalyzer:
         or None if no purchase history exists.
         """
         try:
-            # Get all stock log entries and filter for this product's purchases
-            all_stock_entries = (
-                self._get_stock_log()
+            # Shopping lists ask for many products per analyzer, so the log is
+            # indexed once instead of filtered and sorted per product.
+            latest_purchases = (
+                self._get_latest_purchases()
                 if use_cache
-                else self.grocy_client.list_stock_log()
+                else _index_latest_purchases(self.grocy_client.list_stock_log())
             )
-            stock_entries = [
-                entry
-                for entry in all_stock_entries
-                if entry.product_id == product_id
-                and entry.transaction_type == "purchase"
-            ]
-
-            if not stock_entries:
+            latest = latest_purchases.get(product_id)
+            if latest is None:
                 return None
 
-            # Sort by purchased_date (most recent first)
-            stock_entries.sort(key=lambda x: x.purchased_date or "", reverse=True)
-
-            latest = stock_entries[0]
-
             # Calculate unit price
             amount = latest.amount if latest.amount > 0 else 1
             price = latest.price or 0
@@ -90,3 +90,23 @@ class PriceAnalyzer:
                 extra={"product_id": product_id, "error": str(e)},
             )
             return None
+
+
+def _index_latest_purchases(
+    entries: list[GrocyStockLogEntry],
+) -> dict[int, GrocyStockLogEntry]:
+    """Map product id to its most recent purchase; undated purchases rank last."""
+    latest: dict[int, GrocyStockLogEntry] = {}
+    for entry in entries:
+        if entry.transaction_type != "purchase":
+            continue
+        current = latest.get(entry.product_id)
+        if current is None or (
+            entry.purchased_date is not None
+            and (
+                current.purchased_date is None
+                or entry.purchased_date > current.purchased_date
+            )
+        ):
+            latest[entry.product_id] = entry
+    return latest
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 import time
@@ -9,6 +8,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Iterator
 
+import orjson
 from models.shopping_list import BulkItemUpdate, ShoppingList
 from models.shopping_list_remove import BulkRemoveRequest
 
@@ -54,9 +54,12 @@ class ShoppingListManager:
                 lock_path.unlink(missing_ok=True)
 
     def active_list_exists(self, instance_index: str) -> bool:
-        """Check if active.json exists for this instance"""
-        active_path = self.get_instance_dir(instance_index) / "active.json"
-        return active_path.exists()
+        """Check if active.json exists for this instance
+
+        Only stats the file (the instance dir is not created), so routes can call
+        it on the event loop before paying for a threadpool hop.
+        """
+        return (self.base_path / instance_index / "active.json").is_file()
 
     def load_active_list(self, instance_index: str) -> dict:
         """Load active shopping list from file"""
@@ -64,8 +67,7 @@ class ShoppingListManager:
         if not active_path.exists():
             raise FileNotFoundError(f"No active list for instance {instance_index}")
 
-        with open(active_path) as f:
-            list_data: dict[str, Any] = json.load(f)
+        list_data: dict[str, Any] = orjson.loads(active_path.read_bytes())
 
         updated = self._normalize_list_data(list_data)
         if updated:
@@ -100,8 +102,7 @@ class ShoppingListManager:
 
         # Write to temp file first
         temp_path = active_path.with_suffix(".json.tmp")
-        with open(temp_path, "w") as f:
-            json.dump(payload, f, indent=2)
+        temp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
         # Atomic rename
         temp_path.replace(active_path)
@@ -4,9 +4,13 @@ from core.grocy.inventory import ProductDescriptionMetadataUpdate
 from core.grocy.note_metadata import (
     ProductDescriptionMetadata,
     ProductUnitConversion,
+    PurchaseEntryNoteMetadata,
     validate_note_text,
 )
-from models.grocy import ProductDescriptionMetadataBatchRequest
+from models.grocy import (
+    ProductDescriptionMetadataBatchRequest,
+    PurchaseEntryMetadataPayload,
+)
 
 
 def build_product_metadata_updates(
@@ -38,3 +42,20 @@ def build_product_metadata_updates(
             )
         )
     return updates
+
+
+def build_purchase_note_metadata(
+    payload: PurchaseEntryMetadataPayload,
+) -> PurchaseEntryNoteMetadata:
+    """Validate and translate purchase entry metadata from an API payload."""
+    return PurchaseEntryNoteMetadata(
+        shipping_cost=payload.shipping_cost,
+        tax_rate=payload.tax_rate,
+        brand=payload.brand,
+        package_size=payload.package_size,
+        package_price=payload.package_price,
+        package_quantity=payload.package_quantity,
+        currency=payload.currency,
+        conversion_rate=payload.conversion_rate,
+        on_sale=payload.on_sale,
+    )
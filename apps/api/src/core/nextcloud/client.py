@@ -49,6 +49,20 @@ class NextcloudCalendarClient:
             f"Calendar not found. Requested '{calendar_name}', available: {available_names}"
         )
 
+    def create_event(self, event: NextcloudCalendarEvent) -> str | None:
+        """Create a single calendar event and return its URL when available.
+
+        CalDAV has no multi-resource create, so each event is its own PUT.
+        """
+        calendar = self.calendar_for(event.calendar_name)
+        ical_payload = build_ical_event(event)
+        if event.item_kind == "task":
+            created_event = calendar.add_todo(ical_payload)
+        else:
+            created_event = calendar.add_event(ical_payload)
+        created_url = getattr(created_event, "url", None)
+        return None if created_url is None else str(created_url)
+
     def create_events(self, events: Iterable[NextcloudCalendarEvent]) -> list[str]:
         """Create one or more calendar events and return their URLs when available."""
         event_list = list(events)
@@ -56,15 +70,9 @@ class NextcloudCalendarClient:
             return []
         created_urls: list[str] = []
         for event in event_list:
-            calendar = self.calendar_for(event.calendar_name)
-            ical_payload = build_ical_event(event)
-            if event.item_kind == "task":
-                created_event = calendar.add_todo(ical_payload)
-            else:
-                created_event = calendar.add_event(ical_payload)
-            created_url = getattr(created_event, "url", None)
+            created_url = self.create_event(event)
             if created_url is not None:
-                created_urls.append(str(created_url))
+                created_urls.append(created_url)
         logger.info("Created %s Nextcloud events", len(event_list))
         return created_urls
 
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import os
+from functools import cache
+
+_DEFAULT_THREAD_POOL_SIZE = 100
+
+
+# Read lazily so values from .env (loaded by initialize_server after imports)
+# apply; environment is fixed for the process lifetime, so resolve once.
+@cache
+def resolve_thread_pool_size() -> int:
+    """Return the per-worker thread count for blocking I/O (THREAD_POOL_SIZE)."""
+    value = os.getenv("THREAD_POOL_SIZE")
+    if value is None or not value.strip():
+        return _DEFAULT_THREAD_POOL_SIZE
+    size = int(value)
+    if size < 1:
+        raise ValueError(f"THREAD_POOL_SIZE must be positive, got {size}")
+    return size
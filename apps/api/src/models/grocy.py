@@ -32,6 +32,11 @@ class InitializeInstanceResponse(BaseModel):
     created_shopping_locations: list[CreatedShoppingLocation]
 
 
+class ReloadInstanceResponse(BaseModel):
+    instance_index: str
+    cleared: bool
+
+
 class GrocyLocationPayload(BaseModel):
     id: int
     name: str
@@ -32,6 +32,14 @@ _GRIST_RESPONSE_DUMP_DIR = Path(os.getenv("GRIST_RESPONSE_DUMP_DIR", "request_du
 _IGNORED_RESPONSE_FIELDS: frozenset[str] = frozenset(
     {"material_price_summaries", "receipt"}
 )
+# Purchase posts share one pooled client so bursts reuse keep-alive connections
+# instead of paying TCP/TLS setup per record; created on first use so it binds
+# to the running event loop, and closed from the app lifespan.
+_GRIST_HTTP_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=20, keepalive_expiry=60
+)
+_GRIST_HTTP_TIMEOUT_SECONDS = 30
+_grist_http_client: httpx.AsyncClient | None = None
 
 
 def _describe_dtypes(dataframe: pl.DataFrame) -> dict[str, str]:
@@ -197,6 +205,24 @@ def _log_mixed_type_columns(rows: list[dict[str, Any]]) -> None:
             )
 
 
+def _get_grist_http_client() -> httpx.AsyncClient:
+    global _grist_http_client
+    if _grist_http_client is None:
+        _grist_http_client = httpx.AsyncClient(
+            limits=_GRIST_HTTP_LIMITS, timeout=_GRIST_HTTP_TIMEOUT_SECONDS
+        )
+    return _grist_http_client
+
+
+async def close_grist_http_client() -> None:
+    """Close the pooled Grist HTTP client, if one was opened."""
+
+    global _grist_http_client
+    if _grist_http_client is not None:
+        await _grist_http_client.aclose()
+        _grist_http_client = None
+
+
 async def create_grist_purchase_record(fields: dict[str, Any]) -> None:
     """Post a single purchase record to the configured Grist table."""
 
@@ -224,8 +250,7 @@ async def create_grist_purchase_record(fields: dict[str, Any]) -> None:
     payload = {"records": [{"fields": fields}]}
     headers = {"Authorization": f"Bearer {GRIST_API_KEY}"}
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.post(url, headers=headers, json=payload)
+    response = await _get_grist_http_client().post(url, headers=headers, json=payload)
     try:
         response.raise_for_status()
     except httpx.HTTPStatusError:
@@ -0,0 +1,11 @@
+from core.grist.markdown import escape_markdown_v2
+
+
+def test_escape_markdown_v2_escapes_reserved_characters() -> None:
+    assert escape_markdown_v2("a.b_c[d](e)!") == "a\\.b\\_c\\[d\\]\\(e\\)\\!"
+    assert escape_markdown_v2("back\\slash") == "back\\\\slash"
+
+
+def test_escape_markdown_v2_leaves_plain_text_untouched() -> None:
+    assert escape_markdown_v2("Jane Doe") == "Jane Doe"
+    assert escape_markdown_v2("") == ""
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+from core.grist.rate_limit import MinIntervalRateLimiter
+
+
+def test_concurrent_waiters_are_spaced_by_interval() -> None:
+    async def _run() -> list[float]:
+        limiter = MinIntervalRateLimiter(0.02)
+        loop = asyncio.get_running_loop()
+        released: list[float] = []
+
+        async def _acquire() -> None:
+            await limiter.wait()
+            released.append(loop.time())
+
+        await asyncio.gather(*(_acquire() for _ in range(5)))
+        return released
+
+    released = asyncio.run(_run())
+
+    gaps = [later - earlier for earlier, later in zip(released, released[1:])]
+    assert all(gap >= 0.019 for gap in gaps)
+
+
+def test_idle_limiter_does_not_delay_first_caller() -> None:
+    async def _run() -> float:
+        limiter = MinIntervalRateLimiter(10.0)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await limiter.wait()
+        return loop.time() - started
+
+    assert asyncio.run(_run()) < 1.0
+
+
+def test_rejects_non_positive_interval() -> None:
+    with pytest.raises(ValueError):
+        MinIntervalRateLimiter(0)
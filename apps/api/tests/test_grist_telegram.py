@@ -0,0 +1,82 @@
+from datetime import UTC, datetime
+
+from core.grist.telegram import build_inquiry_message, format_medusa_order_summary
+from models.customer_inquiry_model import Inquiry
+from models.medusa.order_response import MedusaOrder, MedusaOrderResponse
+
+
+def _build_inquiry(preferred_contact_method: str) -> Inquiry:
+    return Inquiry(
+        id=1,
+        manualSort=1,
+        date=datetime(2024, 1, 1, tzinfo=UTC),
+        date_needed_by=datetime(2024, 1, 15, 10, 0, tzinfo=UTC),
+        status="unresolved",
+        customer_first_name="Jane",
+        customer_last_name="Doe",
+        email="jane@kanomnom.com",
+        preferred_contact_method=preferred_contact_method,
+        inquiry_type="Catering",
+        inquiry="Party tray, please!",
+        last_updated=datetime(2024, 1, 1, tzinfo=UTC),
+        location="Shop",
+    )
+
+
+def test_order_summary_without_order_response_is_header_only() -> None:
+    assert (
+        format_medusa_order_summary("order_1", None)
+        == "🧾 *Medusa Order ID:* order\\_1"
+    )
+
+
+def test_order_summary_includes_populated_fields_in_order() -> None:
+    order_response = MedusaOrderResponse(
+        order=MedusaOrder(
+            id="order_1",
+            display_id=42,
+            status="pending",
+            email="jane@example.com",
+            total=12.5,
+            currency_code="usd",
+        )
+    )
+
+    summary = format_medusa_order_summary("order_1", order_response)
+
+    assert summary == (
+        "🧾 *Medusa Order ID:* order\\_1\n"
+        "🔢 *Order Number:* 42\n"
+        "✅ *Order Status:* pending\n"
+        "📧 *Order Email:* jane@example\\.com\n"
+        "💵 *Order Total:* 12\\.5 USD"
+    )
+
+
+def test_order_summary_skips_total_without_currency() -> None:
+    order_response = MedusaOrderResponse(order=MedusaOrder(id="order_1", total=12.5))
+
+    assert format_medusa_order_summary("order_1", order_response) == (
+        "🧾 *Medusa Order ID:* order\\_1"
+    )
+
+
+def test_inquiry_message_lists_preferred_contact_first() -> None:
+    message = build_inquiry_message(_build_inquiry("email"), None)
+
+    assert message == (
+        "📩 *New Inquiry Received*\n"
+        "👤 *Customer:* Jane Doe\n"
+        "📦 *Inquiry Type:* Catering\n"
+        "📝 *Message:* Party tray, please\\!\n"
+        "📅 *Date Needed:* 2024\\-01\\-15 10:00:00\n"
+        "📌 *Contact Information:*\n"
+        "📧 *Email:* jane@kanomnom\\.com _\\(Preferred\\)_\n"
+        "📞 *Phone:* N/A"
+    )
+
+
+def test_inquiry_message_without_preference_lists_phone_first() -> None:
+    message = build_inquiry_message(_build_inquiry(""), None)
+
+    assert message.endswith("📞 *Phone:* N/A\n📧 *Email:* jane@kanomnom\\.com")
@@ -0,0 +1,198 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import pytest
+from caldav.lib.error import PutError
+from core.grist import inquiry_handler
+from core.grist.rate_limit import MinIntervalRateLimiter
+from telegram.error import RetryAfter, TelegramError, TimedOut
+
+_UPDATED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class _FakeCalendarEvent:
+    uid: str
+
+
+class _FakeCalendarClient:
+    def __init__(self, failing_creates: dict[str, list[Exception]]) -> None:
+        self.failing_creates = failing_creates
+        self.created: list[str] = []
+
+    def create_event(self, event: _FakeCalendarEvent) -> str | None:
+        errors = self.failing_creates.get(event.uid)
+        if errors:
+            raise errors.pop()
+        self.created.append(event.uid)
+        return None
+
+
+class _FakeTelegramSender:
+    def __init__(self, failing_sends: dict[str, list[TelegramError]]) -> None:
+        self.failing_sends = failing_sends
+        self.delivered: list[str] = []
+
+    async def send_message(self, chat_id: int, text: str, parse_mode: str) -> None:
+        errors = self.failing_sends.get(text)
+        if errors:
+            raise errors.pop()
+        self.delivered.append(text)
+
+
+class _FakeIdempotencyStore:
+    def __init__(self, fail_telegram_marks: bool) -> None:
+        self.fail_telegram_marks = fail_telegram_marks
+        self.nextcloud_marked: list[tuple[int, str]] = []
+        self.telegram_marked: list[int] = []
+
+    def mark_telegram_sent(
+        self,
+        idempotency_key: str,
+        inquiry_id: int,
+        updated_at: datetime,
+        sent_at: datetime,
+    ) -> None:
+        if self.fail_telegram_marks:
+            raise RuntimeError("idempotency store unavailable")
+        self.telegram_marked.append(inquiry_id)
+
+    def mark_nextcloud_created(
+        self,
+        idempotency_key: str,
+        inquiry_id: int,
+        updated_at: datetime,
+        event_uid: str,
+        created_at: datetime,
+    ) -> None:
+        self.nextcloud_marked.append((inquiry_id, event_uid))
+
+
+@pytest.fixture(autouse=True)
+def fast_send_spacing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        inquiry_handler, "_telegram_send_rate_limiter", MinIntervalRateLimiter(0.001)
+    )
+    monkeypatch.setattr(inquiry_handler, "NOTIFICATION_RETRY_BACKOFF_SECONDS", 0.0)
+
+
+def _calendar_events(
+    *uids: str,
+) -> list[tuple[str, int, datetime, _FakeCalendarEvent]]:
+    return [
+        (f"key-{inquiry_id}", inquiry_id, _UPDATED_AT, _FakeCalendarEvent(uid))
+        for inquiry_id, uid in enumerate(uids, start=1)
+    ]
+
+
+def _messages(*texts: str) -> list[tuple[str, int, datetime, str]]:
+    return [
+        (f"key-{inquiry_id}", inquiry_id, _UPDATED_AT, text)
+        for inquiry_id, text in enumerate(texts, start=1)
+    ]
+
+
+def test_messages_are_sent_in_order_and_marked() -> None:
+    sender = _FakeTelegramSender(failing_sends={})
+    store = _FakeIdempotencyStore(fail_telegram_marks=False)
+
+    asyncio.run(
+        inquiry_handler._send_telegram_messages(
+            _messages("first", "second", "third"), sender, -100, store
+        )
+    )
+
+    assert sender.delivered == ["first", "second", "third"]
+    assert store.telegram_marked == [1, 2, 3]
+
+
+def test_retry_after_is_retried_instead_of_dropped() -> None:
+    sender = _FakeTelegramSender(failing_sends={"second": [RetryAfter(0)]})
+    store = _FakeIdempotencyStore(fail_telegram_marks=False)
+
+    asyncio.run(
+        inquiry_handler._send_telegram_messages(
+            _messages("first", "second", "third"), sender, -100, store
+        )
+    )
+
+    assert sender.delivered == ["first", "second", "third"]
+    assert store.telegram_marked == [1, 2, 3]
+
+
+def test_network_error_is_retried_instead_of_dropped() -> None:
+    sender = _FakeTelegramSender(failing_sends={"second": [TimedOut()]})
+    store = _FakeIdempotencyStore(fail_telegram_marks=False)
+
+    asyncio.run(
+        inquiry_handler._send_telegram_messages(
+            _messages("first", "second"), sender, -100, store
+        )
+    )
+
+    assert sender.delivered == ["first", "second"]
+    assert store.telegram_marked == [1, 2]
+
+
+def test_persistent_rate_limit_gives_up_on_that_message_only() -> None:
+    sender = _FakeTelegramSender(
+        failing_sends={"second": [RetryAfter(0) for _ in range(99)]}
+    )
+    store = _FakeIdempotencyStore(fail_telegram_marks=False)
+
+    asyncio.run(
+        inquiry_handler._send_telegram_messages(
+            _messages("first", "second", "third"), sender, -100, store
+        )
+    )
+
+    assert sender.delivered == ["first", "third"]
+    assert store.telegram_marked == [1, 3]
+    assert len(sender.failing_sends["second"]) == 99 - 3
+
+
+def test_failed_telegram_marking_still_creates_calendar_events() -> None:
+    sender = _FakeTelegramSender(failing_sends={})
+    client = _FakeCalendarClient(failing_creates={})
+    store = _FakeIdempotencyStore(fail_telegram_marks=True)
+    dispatch = inquiry_handler.InquiryDispatch(
+        messages=_messages("first"),
+        calendar_events=_calendar_events("order-1"),
+        nextcloud_client=client,
+        nextcloud_instance_key="000000",
+    )
+
+    asyncio.run(inquiry_handler.dispatch_inquiries(dispatch, store, sender, -100, True))
+
+    assert sender.delivered == ["first"]
+    assert client.created == ["order-1"]
+    assert store.nextcloud_marked == [(1, "order-1")]
+
+
+def test_transient_calendar_error_is_retried() -> None:
+    client = _FakeCalendarClient(
+        failing_creates={"order-1": [PutError("503 Service Unavailable")]}
+    )
+    store = _FakeIdempotencyStore(fail_telegram_marks=False)
+
+    inquiry_handler._create_calendar_events(
+        _calendar_events("order-1"), client, "000000", store
+    )
+
+    assert client.created == ["order-1"]
+    assert store.nextcloud_marked == [(1, "order-1")]
+
+
+def test_calendar_failure_marks_only_created_events() -> None:
+    client = _FakeCalendarClient(
+        failing_creates={"order-2": [RuntimeError("CalDAV rejected order-2")]}
+    )
+    store = _FakeIdempotencyStore(fail_telegram_marks=False)
+
+    inquiry_handler._create_calendar_events(
+        _calendar_events("order-1", "order-2", "order-3"), client, "000000", store
+    )
+
+    assert client.created == ["order-1", "order-3"]
+    assert store.nextcloud_marked == [(1, "order-1"), (3, "order-3")]
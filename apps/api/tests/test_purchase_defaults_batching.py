@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+from api.routes.grocy import purchases
+from core.grocy.exceptions import MetadataNotFoundError
+from core.grocy.purchases import PurchaseEntryDefaults
+
+INSTANCE_INDEX = "test-instance"
+
+
+def _defaults_for(product_id: int) -> PurchaseEntryDefaults:
+    return PurchaseEntryDefaults(
+        shipping_cost=0.0, tax_rate=0.0, on_sale=False, brand=f"brand-{product_id}"
+    )
+
+
+class _FakeManager:
+    def __init__(self, missing_product_ids: set[int]) -> None:
+        self.missing_product_ids = missing_product_ids
+
+    def get_purchase_entry_defaults(
+        self, product_id: int, shopping_location_id: int | None
+    ) -> PurchaseEntryDefaults:
+        if product_id in self.missing_product_ids:
+            raise MetadataNotFoundError(f"Product {product_id} not found")
+        return _defaults_for(product_id)
+
+
+class _FakeGovernor:
+    def __init__(self, manager: _FakeManager) -> None:
+        self.manager = manager
+
+    def manager_for(self, instance_index: str) -> _FakeManager:
+        return self.manager
+
+
+@pytest.fixture
+def batch_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[int]]:
+    """Install a fake governor and record the product ids of every worker call."""
+    monkeypatch.setattr(
+        purchases, "governor", _FakeGovernor(_FakeManager(missing_product_ids={404}))
+    )
+    calls: list[list[int]] = []
+    load_batch = purchases._load_purchase_defaults_batch
+
+    def _recording_load_batch(
+        instance_index: str, product_ids: list[int], shopping_location_id: int | None
+    ) -> dict[int, PurchaseEntryDefaults | Exception]:
+        calls.append(list(product_ids))
+        return load_batch(instance_index, product_ids, shopping_location_id)
+
+    monkeypatch.setattr(
+        purchases, "_load_purchase_defaults_batch", _recording_load_batch
+    )
+    return calls
+
+
+def test_concurrent_waiters_share_one_worker_call(
+    batch_calls: list[list[int]],
+) -> None:
+    async def _run() -> list[PurchaseEntryDefaults]:
+        return await asyncio.gather(
+            purchases._load_purchase_defaults(INSTANCE_INDEX, 1, None),
+            purchases._load_purchase_defaults(INSTANCE_INDEX, 2, None),
+            purchases._load_purchase_defaults(INSTANCE_INDEX, 1, None),
+        )
+
+    results = asyncio.run(_run())
+
+    assert batch_calls == [[1, 2]]
+    assert [result.brand for result in results] == ["brand-1", "brand-2", "brand-1"]
+    assert purchases._pending_purchase_defaults == {}
+
+
+def test_full_batch_flushes_before_window(
+    batch_calls: list[list[int]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(purchases, "_PURCHASE_DEFAULTS_BATCH_MAX_SIZE", 2)
+    monkeypatch.setattr(purchases, "_PURCHASE_DEFAULTS_BATCH_WINDOW_SECONDS", 60.0)
+
+    async def _run() -> list[PurchaseEntryDefaults]:
+        return await asyncio.wait_for(
+            asyncio.gather(
+                purchases._load_purchase_defaults(INSTANCE_INDEX, 1, None),
+                purchases._load_purchase_defaults(INSTANCE_INDEX, 2, None),
+            ),
+            timeout=5,
+        )
+
+    results = asyncio.run(_run())
+
+    assert batch_calls == [[1, 2]]
+    assert [result.brand for result in results] == ["brand-1", "brand-2"]
+
+
+def test_missing_product_fails_only_its_own_waiter(
+    batch_calls: list[list[int]],
+) -> None:
+    async def _run() -> list[PurchaseEntryDefaults | BaseException]:
+        return await asyncio.gather(
+            purchases._load_purchase_defaults(INSTANCE_INDEX, 1, None),
+            purchases._load_purchase_defaults(INSTANCE_INDEX, 404, None),
+            return_exceptions=True,
+        )
+
+    found, missing = asyncio.run(_run())
+
+    assert batch_calls == [[1, 404]]
+    assert isinstance(found, PurchaseEntryDefaults)
+    assert found.brand == "brand-1"
+    assert isinstance(missing, MetadataNotFoundError)
+
+
+def test_cancelled_waiter_is_skipped(batch_calls: list[list[int]]) -> None:
+    async def _run() -> (
+        tuple[asyncio.Task[PurchaseEntryDefaults], PurchaseEntryDefaults]
+    ):
+        cancelled = asyncio.create_task(
+            purchases._load_purchase_defaults(INSTANCE_INDEX, 1, None)
+        )
+        kept = asyncio.create_task(
+            purchases._load_purchase_defaults(INSTANCE_INDEX, 1, None)
+        )
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        # The cancelled future is first in line; resolving it instead of
+        # skipping it would abort the flush and leave the kept waiter hanging.
+        result = await asyncio.wait_for(kept, timeout=5)
+        return cancelled, result
+
+    cancelled, result = asyncio.run(_run())
+
+    assert cancelled.cancelled()
+    assert result.brand == "brand-1"
+    assert batch_calls == [[1]]
@@ -0,0 +1,94 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from api.routes.grocy.purchases import (
+    _booking_stock_ids,
+    _build_purchase_drafts,
+    _select_new_stock_entries,
+)
+from core.grocy.note_metadata import PurchaseEntryNoteMetadata
+from core.grocy.responses import GrocyStockEntry
+from models.grocy import PurchaseEntryRequest
+
+_BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _stock_entry(entry_id: int, stock_id: str, minutes: int) -> GrocyStockEntry:
+    return GrocyStockEntry(
+        id=entry_id,
+        product_id=1,
+        amount=1.0,
+        best_before_date=None,
+        purchased_date=None,
+        stock_id=stock_id,
+        price=2.5,
+        open=False,
+        opened_date=None,
+        row_created_timestamp=_BASE_TIME + timedelta(minutes=minutes),
+        location_id=None,
+        shopping_location_id=None,
+        note=None,
+    )
+
+
+def test_booking_stock_ids_from_list_response() -> None:
+    response = [
+        {"id": 10, "stock_id": "stock-a"},
+        {"id": 11, "stock_id": "stock-b"},
+    ]
+
+    assert _booking_stock_ids(response) == ["stock-a", "stock-b"]
+
+
+def test_booking_stock_ids_from_dict_response() -> None:
+    assert _booking_stock_ids({"id": 10, "stock_id": "stock-a"}) == ["stock-a"]
+
+
+def test_bookings_without_stock_id_fall_back_to_newest_rows(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    stocks = [
+        _stock_entry(1, "old", 0),
+        _stock_entry(2, "newest", 10),
+        _stock_entry(3, "middle", 5),
+    ]
+    recorded_stock_ids = set(_booking_stock_ids([{"id": 10}, {"id": 11}]))
+
+    with caplog.at_level(logging.WARNING):
+        new_entries = _select_new_stock_entries(stocks, recorded_stock_ids, 2)
+
+    assert recorded_stock_ids == set()
+    assert [entry.stock_id for entry in new_entries] == ["middle", "newest"]
+    assert "Purchase entry count mismatch" in caplog.text
+
+
+def test_multi_package_purchase_matches_each_booked_row(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    metadata = PurchaseEntryNoteMetadata(package_size=2.0, package_quantity=3)
+    purchase = PurchaseEntryRequest(amount=6.0, price=1.0)
+    drafts = _build_purchase_drafts(purchase, metadata, 6.0, 1.0, None)
+    # A concurrent purchase created the newest row; matching by stock_id must
+    # not pick it up in place of one of ours.
+    stocks = [
+        _stock_entry(1, "existing", 0),
+        _stock_entry(4, "package-3", 7),
+        _stock_entry(2, "package-1", 5),
+        _stock_entry(5, "concurrent", 9),
+        _stock_entry(3, "package-2", 6),
+    ]
+    recorded_stock_ids: set[str] = set()
+    for package in ("package-1", "package-2", "package-3"):
+        recorded_stock_ids.update(_booking_stock_ids([{"stock_id": package}]))
+
+    with caplog.at_level(logging.WARNING):
+        new_entries = _select_new_stock_entries(stocks, recorded_stock_ids, len(drafts))
+
+    assert [draft.amount for draft in drafts] == [2.0, 2.0, 2.0]
+    assert [entry.stock_id for entry in new_entries] == [
+        "package-1",
+        "package-2",
+        "package-3",
+    ]
+    assert "Purchase entry count mismatch" not in caplog.text